@@ -0,0 +1,202 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmark configuration.
+
+The benchmarks are not part of the test suite. Install the ``benchmarks`` extra and
+run them with:
+
+.. code-block:: console
+
+    $ python -m pytest benchmarks --no-cov
+
+Compare against a saved run with ``--benchmark-autosave`` and
+``--benchmark-compare``. The memory allocated by a single call of each benchmark is
+shown after the timings, and stored in its ``extra_info``.
+
+The component benchmarks use the database of pytest-invenio, which is SQLite unless
+``SQLALCHEMY_DATABASE_URI`` is set.
+"""
+
+import gc
+import tracemalloc
+
+import pytest
+from invenio_app.factory import create_app as _create_app
+
+
+@pytest.fixture(scope="module")
+def create_app(instance_path):
+    """Application factory fixture."""
+    return _create_app
+
+
+@pytest.fixture(scope="module")
+def app_config(app_config):
+    """Enable the checks component."""
+    app_config["CHECKS_ENABLED"] = True
+    return app_config
+
+
+def _person(i):
+    """Build a creator of a record."""
+    return {
+        "person_or_org": {
+            "type": "personal",
+            "name": f"Family {i}, Given {i}",
+            "given_name": f"Given {i}",
+            "family_name": f"Family {i}",
+            "identifiers": [
+                {"scheme": "orcid", "identifier": f"0000-0000-0000-{i:04}"}
+            ],
+        },
+        "affiliations": [{"id": "01ggx4157", "name": "CERN"}],
+        "role": {"id": "author" if i % 10 else "editor"},
+    }
+
+
+def build_small_record():
+    """Build a record with a few fields."""
+    return {
+        "access": {"record": "public", "files": "public"},
+        "metadata": {
+            "title": "Benchmark record",
+            "resource_type": {"id": "publication-article"},
+            "publication_date": "2026-01-01",
+            "creators": [_person(0)],
+            "rights": [{"id": "cc-by-4.0"}],
+            "languages": [{"id": "eng"}],
+            "subjects": [{"subject": "physics"}, {"subject": "benchmarks"}],
+            "description": "A description that is long enough for the min checks.",
+        },
+        "custom_fields": {"journal:journal": {"title": "Journal of benchmarks"}},
+    }
+
+
+def build_creators_record(count=1000):
+    """Build a record with many creators."""
+    record = build_small_record()
+    record["metadata"]["creators"] = [_person(i) for i in range(count)]
+    return record
+
+
+def build_nested_record(depth=10, width=5):
+    """Build a record with deeply nested custom fields."""
+    record = build_small_record()
+    node = {"value": "leaf", "items": [{"value": i} for i in range(width)]}
+    for level in reversed(range(depth)):
+        node = {
+            f"level{level}": node,
+            "siblings": [{"value": f"{level}.{i}"} for i in range(width)],
+        }
+    record["custom_fields"]["bench:nested"] = node
+    return record
+
+
+RECORDS = {
+    "small": build_small_record,
+    "creators_1k": build_creators_record,
+    "nested": build_nested_record,
+}
+
+
+@pytest.fixture(scope="module")
+def small_record():
+    """A record with a few fields."""
+    return build_small_record()
+
+
+@pytest.fixture(scope="module")
+def creators_record():
+    """A record with 1k creators."""
+    return build_creators_record()
+
+
+@pytest.fixture(scope="module")
+def nested_record():
+    """A record with deeply nested custom fields."""
+    return build_nested_record()
+
+
+@pytest.fixture(params=list(RECORDS), scope="module")
+def record(request):
+    """Each kind of synthetic record."""
+    return RECORDS[request.param]()
+
+
+def allocations(func, *args):
+    """Measure the memory allocated by one call of a function.
+
+    ``peak_bytes`` is the most memory in use during the call, ``retained_blocks``
+    and ``retained_bytes`` is what is still referenced afterwards (mostly the
+    results).
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.clear_traces()
+        tracemalloc.reset_peak()
+        result = func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        stats = tracemalloc.take_snapshot().statistics("filename")
+    finally:
+        tracemalloc.stop()
+    del result
+    return {
+        "peak_bytes": peak,
+        "retained_blocks": sum(stat.count for stat in stats),
+        "retained_bytes": sum(stat.size for stat in stats),
+    }
+
+
+_reports = {}
+
+
+@pytest.fixture
+def report(request):
+    """Add a row to a table shown after the timings of pytest-benchmark."""
+
+    def _report(section, info):
+        _reports.setdefault(section, {})[request.node.name] = info
+
+    return _report
+
+
+@pytest.fixture
+def bench(benchmark, report):
+    """Benchmark a function, also recording its allocations."""
+
+    def _bench(func, *args):
+        result = benchmark(func, *args)
+        info = allocations(func, *args)
+        benchmark.extra_info.update(info)
+        report("allocations per call", info)
+        return result
+
+    return _bench
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Show the extra reports of the benchmarks."""
+    for section, rows in _reports.items():
+        terminalreporter.section(section)
+        columns = list(next(iter(rows.values())))
+        widths = [max(len(name) for name in rows)] + [
+            max(len(column), 12) for column in columns
+        ]
+        terminalreporter.write_line(
+            "  ".join(
+                [f"{'Name':<{widths[0]}}"]
+                + [f"{column:>{width}}" for column, width in zip(columns, widths[1:])]
+            )
+        )
+        for name, info in sorted(rows.items()):
+            terminalreporter.write_line(
+                "  ".join(
+                    [f"{name:<{widths[0]}}"]
+                    + [
+                        f"{info[column]:>{width}}"
+                        for column, width in zip(columns, widths[1:])
+                    ]
+                )
+            )
@@ -0,0 +1,307 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Latency benchmarks of the checks service component hooks.
+
+Each hook is called on a draft with the metadata check configured in its
+communities. Besides the timings of pytest-benchmark, the p50/p95 of the wall time
+of the hook, of the time spent in DB queries and of the time spent in ``Check.run``
+are shown after the timings.
+"""
+
+import copy
+import json
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from invenio_communities.communities.records.models import CommunityMetadata
+from invenio_records_resources.services.uow import UnitOfWork
+from sqlalchemy import event
+
+from invenio_checks.components import ChecksComponent
+from invenio_checks.models import CheckConfig, CheckRun, CheckRunStatus, Severity
+from invenio_checks.proxies import current_checks_registry
+
+ROUNDS = 40
+
+
+@dataclass
+class Scenario:
+    """Size of the data a hook works on."""
+
+    configs: int = 1
+    """Check configurations per community."""
+
+    communities: int = 1
+    """Communities of the draft."""
+
+    parents: bool = False
+    """Whether each community has a parent, with its own configurations."""
+
+    past_runs: int = 0
+    """Runs of other records in the table."""
+
+
+SCENARIOS = {
+    "baseline": Scenario(),
+    "configs": Scenario(configs=20),
+    "communities": Scenario(communities=10),
+    "parents": Scenario(communities=10, parents=True),
+    "past_runs": Scenario(configs=5, past_runs=10000),
+}
+
+
+def load_rules():
+    """Load the example rules of the tests."""
+    path = os.path.join(os.path.dirname(__file__), "..", "tests", "example.json")
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def passing_record(small_record):
+    """Build a record passing all the example rules."""
+    record = copy.deepcopy(small_record)
+    record["metadata"]["funding"] = [{"funder": {"id": "00k4n6c32"}}]
+    return record
+
+
+class FakeRecord(dict):
+    """Record or draft with the attributes read by the component."""
+
+    def __init__(self, data, id_, communities, is_draft=True):
+        """Initialize the record."""
+        super().__init__(data)
+        self.id = id_
+        self.revision_id = 1
+        self.is_draft = is_draft
+        self.parent = SimpleNamespace(communities=communities)
+
+
+class HookTimer:
+    """Collect the wall, DB query and check run times of each call of a hook."""
+
+    def __init__(self, engine, monkeypatch):
+        """Start collecting the time of the queries and of the checks."""
+        self.samples = []
+        self.db_time = self.run_time = 0.0
+        self.queries = 0
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def after(conn, cursor, statement, parameters, context, executemany):
+            self.db_time += time.perf_counter() - conn.info["query_start"].pop()
+            self.queries += 1
+
+        self._listeners = [(engine, "before_cursor_execute", before)]
+        self._listeners.append((engine, "after_cursor_execute", after))
+
+        for check_cls in current_checks_registry.get_all().values():
+            monkeypatch.setattr(check_cls, "run", self._timed(check_cls.run))
+
+    def _timed(self, run):
+        """Wrap ``Check.run`` to add up its time."""
+
+        def timed_run(check, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return run(check, *args, **kwargs)
+            finally:
+                self.run_time += time.perf_counter() - start
+
+        return timed_run
+
+    def __call__(self, func, *args, **kwargs):
+        """Call a hook, recording its times."""
+        self.db_time = self.run_time = 0.0
+        self.queries = 0
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        wall = time.perf_counter() - start
+        self.samples.append((wall, self.db_time, self.run_time, self.queries))
+        return result
+
+    def remove(self):
+        """Stop collecting the time of the queries."""
+        for target, name, listener in self._listeners:
+            event.remove(target, name, listener)
+
+    def summary(self):
+        """Get the p50 and p95 of the times in milliseconds."""
+
+        def percentile(values, p):
+            values = sorted(values)
+            return values[min(len(values) - 1, round(p * (len(values) - 1)))]
+
+        wall, db_time, run_time, queries = zip(*self.samples)
+        return {
+            "wall_p50_ms": round(percentile(wall, 0.50) * 1000, 2),
+            "wall_p95_ms": round(percentile(wall, 0.95) * 1000, 2),
+            "db_p95_ms": round(percentile(db_time, 0.95) * 1000, 2),
+            "check_run_p95_ms": round(percentile(run_time, 0.95) * 1000, 2),
+            "queries": max(queries),
+        }
+
+
+@pytest.fixture(params=list(SCENARIOS))
+def scenario(request, db, small_record):
+    """Create the communities, the configurations and the past runs."""
+    scenario = SCENARIOS[request.param]
+    rules = load_rules()
+
+    def create_community(parent=None):
+        model = CommunityMetadata(id=uuid.uuid4(), slug=str(uuid.uuid4()), data={})
+        db.session.add(model)
+        return SimpleNamespace(id=model.id, parent=parent)
+
+    communities = []
+    for _ in range(scenario.communities):
+        parent = create_community() if scenario.parents else None
+        communities.append(create_community(parent))
+    db.session.flush()
+
+    configs = []
+    for community in communities:
+        owners = [community] + ([community.parent] if community.parent else [])
+        for owner in owners:
+            for _ in range(scenario.configs):
+                config = CheckConfig(
+                    check_id="metadata",
+                    community_id=owner.id,
+                    params=rules,
+                    severity=Severity.INFO,
+                    enabled=True,
+                    target_type="record",
+                )
+                db.session.add(config)
+                configs.append(config)
+    db.session.flush()
+
+    if scenario.past_runs:
+        created = datetime(2026, 1, 1)
+        db.session.execute(
+            CheckRun.__table__.insert(),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "config_id": configs[i % len(configs)].id,
+                    "record_id": uuid.uuid4(),
+                    "is_draft": bool(i % 2),
+                    "revision_id": 1,
+                    "status": CheckRunStatus.COMPLETED,
+                    "state": {},
+                    "result": {},
+                    "created": created,
+                    "updated": created,
+                }
+                for i in range(scenario.past_runs)
+            ],
+        )
+    db.session.commit()
+
+    record_id = uuid.uuid4()
+    return SimpleNamespace(
+        draft=FakeRecord(passing_record(small_record), record_id, communities),
+        record=FakeRecord(
+            passing_record(small_record), record_id, communities, is_draft=False
+        ),
+    )
+
+
+@pytest.fixture
+def timer(db, monkeypatch):
+    """Time the DB queries and the check runs of the hooks."""
+    timer = HookTimer(db.engine, monkeypatch)
+    yield timer
+    timer.remove()
+
+
+def call_hook(name, db, **kwargs):
+    """Call a hook of the component in its own unit of work, as a request does."""
+    with UnitOfWork(db.session) as uow:
+        component = ChecksComponent(service=None)
+        component.uow = uow
+        getattr(component, name)(identity=None, **kwargs)
+        uow.commit()
+
+
+def save_draft(db, draft, change=True):
+    """Save a new revision of the draft, changing a field read by the rules."""
+    draft.revision_id += 1
+    if change:
+        license_id = "cc-by-4.0" if draft.revision_id % 2 else "cc-by-3.0"
+        draft["metadata"]["rights"] = [{"id": license_id}]
+    call_hook("update_draft", db, data=None, record=draft, errors=[])
+
+
+def publish(db, draft, record):
+    """Publish the draft."""
+    record.revision_id = draft.revision_id
+    call_hook("publish", db, draft=draft, record=record)
+
+
+def run_hook(benchmark, report, timer, target, setup=None):
+    """Benchmark a hook, reporting the breakdown of its times."""
+    benchmark.pedantic(
+        lambda: timer(target),
+        setup=setup,
+        rounds=ROUNDS,
+        iterations=1,
+    )
+    info = timer.summary()
+    benchmark.extra_info.update(info)
+    report("component hook latency", info)
+
+
+@pytest.mark.parametrize("change", [True, False], ids=["changed", "unchanged"])
+def test_update_draft(benchmark, report, db, scenario, timer, change):
+    """Benchmark saving a draft, with or without changes to the checked fields."""
+    save_draft(db, scenario.draft)
+    run_hook(
+        benchmark,
+        report,
+        timer,
+        lambda: save_draft(db, scenario.draft, change=change),
+    )
+
+
+def test_edit(benchmark, report, db, scenario, timer):
+    """Benchmark editing a published record."""
+    save_draft(db, scenario.draft)
+    publish(db, scenario.draft, scenario.record)
+    run_hook(
+        benchmark,
+        report,
+        timer,
+        lambda: call_hook("edit", db, draft=scenario.draft, record=scenario.record),
+    )
+
+
+def test_publish(benchmark, report, db, scenario, timer):
+    """Benchmark publishing a draft."""
+    run_hook(
+        benchmark,
+        report,
+        timer,
+        lambda: publish(db, scenario.draft, scenario.record),
+        # Every publish needs the runs of a saved draft
+        setup=lambda: save_draft(db, scenario.draft),
+    )
+
+
+def test_submit_record(benchmark, report, db, scenario, timer):
+    """Benchmark submitting a draft for review."""
+    save_draft(db, scenario.draft)
+    run_hook(
+        benchmark,
+        report,
+        timer,
+        lambda: call_hook("submit_record", db, record=scenario.draft),
+    )
@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmarks of the metadata check expressions and rules."""
+
+import pytest
+
+from invenio_checks.contrib.metadata.check import MetadataCheckConfig
+from invenio_checks.contrib.metadata.expressions import ComparisonExpression
+from invenio_checks.contrib.metadata.rules import ExpressionParser
+
+NESTED_PATH = "custom_fields.bench:nested." + ".".join(
+    f"level{level}" for level in range(10)
+)
+
+
+def field(path):
+    """Build a field expression configuration."""
+    return {"type": "field", "path": path}
+
+
+def comparison(path, operator, right):
+    """Build a comparison expression configuration."""
+    return {
+        "type": "comparison",
+        "left": field(path),
+        "operator": operator,
+        "right": right,
+    }
+
+
+def list_expr(operator, path, predicate=None):
+    """Build a list expression configuration."""
+    config = {"type": "list", "operator": operator, "path": path}
+    if predicate is not None:
+        config["predicate"] = predicate
+    return config
+
+
+def logical(operator, *expressions):
+    """Build a logical expression configuration."""
+    return {"type": "logical", "operator": operator, "expressions": list(expressions)}
+
+
+RESOURCE_TYPES = [f"type-{i}" for i in range(50)] + ["publication-article"]
+
+OPERATOR_EXPRESSIONS = {
+    "==": comparison("metadata.resource_type.id", "==", "publication-article"),
+    "!=": comparison("access.record", "!=", "restricted"),
+    "~=": comparison("metadata.title", "~=", "record"),
+    "!~=": comparison("metadata.title", "!~=", "draft"),
+    "^=": comparison("metadata.publication_date", "^=", ["2024", "2025", "2026"]),
+    "!^=": comparison("metadata.publication_date", "!^=", "1999"),
+    "$=": comparison("metadata.rights.0.id", "$=", ["-3.0", "-4.0"]),
+    "!$=": comparison("metadata.rights.0.id", "!$=", "-nc"),
+    "in": comparison("metadata.resource_type.id", "in", RESOURCE_TYPES),
+    "not in": comparison("access.record", "not in", ["restricted", "embargoed"]),
+    "min": comparison("metadata.description", "min", 20),
+    "max": comparison("metadata.title", "max", 255),
+}
+
+LIST_EXPRESSIONS = {
+    # Decided at the last creator
+    "any": list_expr("any", "metadata.creators", comparison("role.id", "==", "other")),
+    "all": list_expr(
+        "all",
+        "metadata.creators",
+        list_expr("exists", "affiliations"),
+    ),
+    "exists": list_expr("exists", "metadata.creators"),
+}
+
+
+def nested_logical(depth):
+    """Build alternating ``and``/``or`` expressions nested ``depth`` times."""
+    expr = comparison("access.files", "==", "public")
+    for level in range(depth):
+        expr = logical(
+            "and" if level % 2 else "or",
+            expr,
+            comparison("metadata.title", "~=", "record"),
+        )
+    return expr
+
+
+RULES = {
+    "id": "benchmark",
+    "title": "Benchmark rules",
+    "rules": [
+        {
+            "id": "access:open/publication",
+            "title": "Open Access Publication",
+            "message": "Publication articles must be Open Access",
+            "level": "error",
+            "condition": OPERATOR_EXPRESSIONS["=="],
+            "checks": [comparison("access.files", "==", "public")],
+        },
+        {
+            "id": "operators",
+            "title": "All operators",
+            "message": "Every operator",
+            "level": "warning",
+            "checks": list(OPERATOR_EXPRESSIONS.values()),
+        },
+        {
+            "id": "creators:identifiers",
+            "title": "Creator identifiers",
+            "message": "Creators must have an ORCID",
+            "level": "info",
+            "checks": [
+                list_expr(
+                    "all",
+                    "metadata.creators",
+                    list_expr(
+                        "any",
+                        "person_or_org.identifiers",
+                        comparison("scheme", "==", "orcid"),
+                    ),
+                ),
+                LIST_EXPRESSIONS["any"],
+            ],
+        },
+        {
+            "id": "journal",
+            "title": "Journal",
+            "message": "Articles must state the journal",
+            "level": "error",
+            "condition": logical(
+                "and",
+                OPERATOR_EXPRESSIONS["=="],
+                logical("or", OPERATOR_EXPRESSIONS["in"], OPERATOR_EXPRESSIONS["!="]),
+            ),
+            "checks": [
+                comparison("custom_fields.journal:journal.title", "min", 1),
+                nested_logical(6),
+            ],
+        },
+        {
+            "id": "nested",
+            "title": "Nested custom fields",
+            "message": "The nested custom field must have a leaf",
+            "level": "info",
+            "checks": [
+                comparison(f"{NESTED_PATH}.value", "==", "leaf"),
+                list_expr("all", f"{NESTED_PATH}.items", field("value")),
+                list_expr(
+                    "any",
+                    "custom_fields.bench:nested.siblings",
+                    comparison("value", "^=", "0."),
+                ),
+            ],
+        },
+    ],
+}
+
+
+@pytest.mark.parametrize("operator", list(OPERATOR_EXPRESSIONS))
+def test_operator(bench, operator, small_record):
+    """Benchmark each comparison operator on a small record."""
+    expr = ExpressionParser.parse(OPERATOR_EXPRESSIONS[operator])
+    assert isinstance(expr, ComparisonExpression)
+    assert bench(expr.compile(), small_record, None).success
+
+
+@pytest.mark.parametrize("operator", list(LIST_EXPRESSIONS))
+def test_list_expression(bench, operator, creators_record):
+    """Benchmark the list operators over 1k creators."""
+    expr = ExpressionParser.parse(LIST_EXPRESSIONS[operator])
+    bench(expr.compile(), creators_record, None)
+
+
+@pytest.mark.parametrize("short_circuit", [False, True], ids=["full", "short"])
+@pytest.mark.parametrize("depth", [2, 8, 32])
+def test_logical_nesting(bench, depth, short_circuit, small_record):
+    """Benchmark nested ``and``/``or`` expressions."""
+    expr = ExpressionParser.parse(nested_logical(depth))
+    assert bench(expr.compile(short_circuit), small_record, None).success
+
+
+def test_nested_field(bench, nested_record):
+    """Benchmark reading a deeply nested custom field."""
+    expr = ExpressionParser.parse(field(f"{NESTED_PATH}.value"))
+    assert bench(expr.compile(), nested_record, None).value == "leaf"
+
+
+@pytest.mark.parametrize("short_circuit", [False, True], ids=["full", "short"])
+def test_rule_set(bench, record, short_circuit):
+    """Benchmark evaluating the whole rule set on each kind of record."""
+    config = MetadataCheckConfig.from_dict(RULES)
+    result = bench(config.evaluate, record, short_circuit)
+    assert len(result.rule_results) == len(RULES["rules"])
@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Add input digest to check runs."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1792237145"
+down_revision = "1784902219"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.add_column("checks_run", sa.Column("input_digest", sa.String(64), nullable=True))
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_column("checks_run", "input_digest")
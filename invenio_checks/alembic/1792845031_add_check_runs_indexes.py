@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Add indexes for the lookups and the cleanup of check runs."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1792845031"
+down_revision = "1792237145"
+branch_labels = ()
+depends_on = None
+
+UNFINISHED = sa.text("status IN ('P', 'R')")
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_index(
+        "idx_checks_run_record_id_is_draft",
+        "checks_run",
+        ["record_id", "is_draft"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_checks_run_unfinished_start_time",
+        "checks_run",
+        ["status", "start_time"],
+        unique=False,
+        postgresql_where=UNFINISHED,
+        sqlite_where=UNFINISHED,
+    )
+    op.create_index(
+        "idx_checks_run_unfinished_updated",
+        "checks_run",
+        ["status", "updated"],
+        unique=False,
+        postgresql_where=UNFINISHED,
+        sqlite_where=UNFINISHED,
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index("idx_checks_run_unfinished_updated", table_name="checks_run")
+    op.drop_index("idx_checks_run_unfinished_start_time", table_name="checks_run")
+    op.drop_index("idx_checks_run_record_id_is_draft", table_name="checks_run")
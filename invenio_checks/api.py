@@ -4,32 +4,238 @@
 
 """Checks API."""
 
-from datetime import datetime, timezone
+import functools
+import json
+import time
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from datetime import datetime, timedelta, timezone
 
-from flask import current_app
+from flask import copy_current_request_context, current_app, has_request_context
+from invenio_cache import current_cache
+from invenio_communities.communities.records.models import CommunityMetadata
 from invenio_db import db
 from invenio_db.uow import ModelCommitOp
 from invenio_records_resources.services.errors import PermissionDeniedError
-from invenio_records_resources.services.uow import TaskOp, UnitOfWork
-from sqlalchemy import or_
+from invenio_records_resources.services.uow import Operation, UnitOfWork
+from sqlalchemy import cast, func, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import (
+    contains_eager,
+    joinedload,
+    make_transient_to_detached,
+    selectinload,
+)
 
+from .base import Check
+from .cache import ConfigsCache
 from .models import CheckConfig, CheckRun, CheckRunStatus
-from .proxies import current_checks_registry, current_targets_registry
-from .tasks import run_check_async
+from .proxies import (
+    current_checks_metrics,
+    current_checks_registry,
+    current_targets_registry,
+)
+from .tasks import run_checks_async
+from .utils import classproperty
+
+
+class RunChecksTaskOp(Operation):
+    """Run the async checks of a unit of work in a single task, after its commit.
+
+    The runs of checks with a debounce window are sent in a task of their own,
+    delayed by the window. A run already waiting in such a task is not sent again,
+    so the saves of a draft during the window end up in a single run of the check,
+    on the draft as it is when the task runs.
+
+    Runs of checks routed to different queues or priorities are sent in different
+    tasks. Units of work marked as ``bulk`` use the priority of bulk work.
+    """
+
+    _ops = weakref.WeakKeyDictionary()
+
+    debounce_key = "invenio_checks:debounce:{}"
+
+    def __init__(self):
+        """Initialize the operation."""
+        self.check_runs = {}
+        self.bulk = False
+
+    @classmethod
+    def get(cls, uow):
+        """Get the operation of a unit of work, registering it if needed."""
+        op = cls._ops.get(uow)
+        if op is None:
+            op = cls._ops[uow] = cls()
+            uow.register(op)
+        return op
+
+    @classmethod
+    def add(cls, uow, run):
+        """Add a check run to the task of the unit of work."""
+        cls.get(uow).check_runs[str(run.id)] = run.config.check_id
+
+    def on_post_commit(self, uow):
+        """Send the tasks."""
+        batches = {}
+        for check_run_id, check_id in self.check_runs.items():
+            debounce = ChecksAPI.get_debounce(check_id)
+            # Only one task at a time may wait for a debounced run. The key expires
+            # in case the task is lost.
+            if debounce and not current_cache.add(
+                self.debounce_key.format(check_run_id), True, timeout=2 * debounce
+            ):
+                continue
+            options = ChecksAPI.get_task_options(check_id, bulk=self.bulk)
+            # The options may hold lists or dicts, e.g. a routing key or headers
+            key = (debounce, json.dumps(options, sort_keys=True, default=repr))
+            batch = batches.setdefault(key, (debounce, options, []))
+            batch[2].append((check_run_id, check_id))
+
+        for debounce, options, runs in batches.values():
+            # Unless routed with time limits, the task has the time of all its runs
+            limits = {}
+            for _, check_id in runs:
+                check_limits = ChecksAPI.get_check_cls(check_id).time_limits()
+                for limit, seconds in check_limits.items():
+                    limits[limit] = limits.get(limit, 0) + seconds
+            options = {**limits, **options}
+            check_run_ids = [check_run_id for check_run_id, _ in runs]
+            try:
+                if debounce:
+                    run_checks_async.apply_async(
+                        args=[check_run_ids],
+                        kwargs={"debounced": True},
+                        countdown=debounce,
+                        **options,
+                    )
+                else:
+                    run_checks_async.apply_async(args=[check_run_ids], **options)
+            except Exception:
+                current_app.logger.exception(
+                    "Error sending async check runs",
+                    extra={"check_run_count": len(check_run_ids)},
+                )
+                if debounce:
+                    # Release the debounce window, so that the next save sends the
+                    # runs again. Runs left PENDING are failed by the stale runs
+                    # cleanup.
+                    current_cache.delete_many(
+                        *[self.debounce_key.format(id_) for id_ in check_run_ids]
+                    )
 
 
 class ChecksAPI:
     """API for managing checks."""
 
+    _config_loaders = {"joined": joinedload, "selectin": selectinload}
+
+    _debounce_cfg = "CHECKS_ASYNC_DEBOUNCE"
+    _task_routes_cfg = "CHECKS_TASK_ROUTES"
+    _task_priorities_cfg = "CHECKS_TASK_PRIORITIES"
+    _executor_workers_cfg = "CHECKS_SYNC_EXECUTOR_WORKERS"
+    _sync_budget_cfg = "CHECKS_SYNC_BUDGET_MS"
+
+    _upsert_inserts = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+    _configs_cache_enabled_cfg = "CHECKS_CONFIGS_CACHE_ENABLED"
+    _configs_cache_ttl_cfg = "CHECKS_CONFIGS_CACHE_TTL"
+
+    @classproperty
+    @functools.cache
+    def configs_cache(cls) -> ConfigsCache:
+        """Get the process-local cache of check configurations."""
+        return ConfigsCache(ttl=current_app.config.get(cls._configs_cache_ttl_cfg, 300))
+
+    @classmethod
+    def get_debounce(cls, check_id):
+        """Get the debounce window of the async runs of a check, in seconds.
+
+        ``CHECKS_ASYNC_DEBOUNCE`` overrides the ``debounce`` of the check class.
+        """
+        overrides = current_app.config.get(cls._debounce_cfg) or {}
+        if check_id in overrides:
+            return overrides[check_id]
+        return cls.get_check_cls(check_id).debounce
+
+    @classmethod
+    def get_check_cls(cls, check_id):
+        """Get the class of a check, or the base class if it is not registered."""
+        try:
+            return current_checks_registry.get(check_id)
+        except ValueError:
+            return Check
+
+    @classmethod
+    def get_task_options(cls, check_id=None, bulk=False):
+        """Get the Celery options of the async tasks of a check.
+
+        The priority of ``CHECKS_TASK_PRIORITIES`` for interactive or bulk work is
+        overridden by the options of the check in ``CHECKS_TASK_ROUTES``, which are
+        applied over the ones of ``"*"``.
+        """
+        priorities = current_app.config.get(cls._task_priorities_cfg) or {}
+        routes = current_app.config.get(cls._task_routes_cfg) or {}
+
+        options = {}
+        priority = priorities.get("bulk" if bulk else "interactive")
+        if priority is not None:
+            options["priority"] = priority
+        options.update(routes.get("*", {}))
+        if check_id is not None:
+            options.update(routes.get(check_id, {}))
+        return options
+
+    @classmethod
+    def config_loader(cls):
+        """Get the loader option of the configurations of the runs read together.
+
+        The strategy is set with ``CHECKS_RUNS_CONFIG_LOADER``.
+        """
+        strategy = current_app.config.get("CHECKS_RUNS_CONFIG_LOADER", "selectin")
+        loader = cls._config_loaders.get(strategy)
+        if loader is None:
+            raise ValueError(f"Invalid check runs config loader: {strategy}")
+        return loader(CheckRun.config)
+
     @classmethod
-    def get_runs(cls, record, is_draft=None, community_id=None):
-        """Get all check runs for an object."""
+    def get_runs(cls, record, is_draft=None, community_id=None, with_config=True):
+        """Get all check runs for an object.
+
+        With ``with_config``, the configurations of the runs are loaded along with
+        them instead of one query per run.
+
+        With ``community_id``, only the runs of the enabled configurations of the
+        community, of its parent and the global ones are returned.
+        """
         if is_draft is None and getattr(record, "is_draft", None) is not None:
             is_draft = record.is_draft
 
         query = CheckRun.query.filter_by(record_id=record.id, is_draft=is_draft)
 
+        in_parent = None
+        if community_id is not None:
+            in_parent = cls._in_parent_community(community_id)
+        if in_parent is not None:
+            # Filter on the configurations and the parent community in the same
+            # statement as the runs.
+            query = query.join(CheckRun.config).filter(
+                CheckConfig.enabled.is_(True),
+                or_(
+                    CheckConfig.community_id.is_(None),
+                    CheckConfig.community_id == community_id,
+                    in_parent,
+                ),
+            )
+            if with_config:
+                query = query.options(contains_eager(CheckRun.config))
+            return query.all()
+
+        if with_config:
+            query = query.options(cls.config_loader())
+
         if community_id is not None:
             from invenio_communities.proxies import current_communities
 
@@ -42,12 +248,39 @@ class ChecksAPI:
 
         return query.all()
 
+    @classmethod
+    def _in_parent_community(cls, community_id):
+        """Get an SQL condition for configurations of the parent of a community.
+
+        The parent is read from the community's JSON in a subquery. Returns ``None``
+        if the database stores UUIDs in a way it can not be compared with.
+        """
+        parent_id = (
+            select(CommunityMetadata.json[("parent", "id")].as_string())
+            .where(CommunityMetadata.id == community_id)
+            .scalar_subquery()
+        )
+        dialect = db.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            return CheckConfig.community_id == cast(
+                parent_id, postgresql.UUID(as_uuid=True)
+            )
+        if dialect == "sqlite":
+            # UUIDs are stored as 16 bytes, the JSON value is the dashed hex string
+            return func.hex(CheckConfig.community_id) == func.upper(
+                func.replace(parent_id, "-", "")
+            )
+        return None
+
     @classmethod
     def get_configs(cls, community_ids, target_type=None):
         """Get all check configurations for a list of community IDs.
 
         Always include the global checks configs to the community checks.
         """
+        if current_app.config.get(cls._configs_cache_enabled_cfg, False):
+            return cls._get_cached_configs(community_ids, target_type)
+
         conditions = [CheckConfig.community_id.is_(None)]
 
         if community_ids:
@@ -62,6 +295,38 @@ class ChecksAPI:
 
         return query.all()
 
+    @classmethod
+    def _get_cached_configs(cls, community_ids, target_type=None):
+        """Get the check configurations of the communities through the cache."""
+        cache = cls.configs_cache
+        generation = cache.generation()
+
+        def load(community_id):
+            query = CheckConfig.query.filter(
+                CheckConfig.enabled.is_(True),
+                (
+                    CheckConfig.community_id.is_(None)
+                    if community_id is None
+                    else CheckConfig.community_id == community_id
+                ),
+            )
+            if target_type is not None:
+                query = query.filter(CheckConfig.target_type == target_type)
+            return query.all()
+
+        configs = []
+        community_ids = {str(community_id) for community_id in community_ids or []}
+        for community_id in [None, *sorted(community_ids)]:
+            configs.extend(
+                cache.get(
+                    community_id,
+                    target_type,
+                    functools.partial(load, community_id),
+                    generation=generation,
+                )
+            )
+        return configs
+
     @classmethod
     def _create_or_update_check_run(
         cls,
@@ -74,9 +339,31 @@ class ChecksAPI:
         result=None,
         start_time=None,
         end_time=None,
+        input_digest=None,
+        new_runs=None,
     ):
-        """Create or update check run if already exists."""
-        if not previous_run:
+        """Create or update check run if already exists.
+
+        With ``new_runs``, a new run is only added to it, to be written later by
+        :meth:`_upsert_check_runs`.
+        """
+        if not previous_run and new_runs is not None:
+            result_run = CheckRun(
+                id=uuid.uuid4(),
+                config_id=config.id,
+                config=config,
+                record_id=record.id,
+                is_draft=is_draft,
+                revision_id=record.revision_id,
+                start_time=start_time,
+                end_time=end_time,
+                status=status,
+                state=state,
+                result=result or {},
+                input_digest=input_digest,
+            )
+            new_runs[result_run] = False
+        elif not previous_run:
             result_run = CheckRun(
                 config=config,
                 record_id=record.id,
@@ -87,6 +374,7 @@ class ChecksAPI:
                 status=status,
                 state=state,
                 result=result or {},
+                input_digest=input_digest,
             )
             try:
                 # In a nested transaction, so a duplicate row rolls back this INSERT
@@ -110,6 +398,7 @@ class ChecksAPI:
                     result,
                     start_time,
                     end_time,
+                    input_digest,
                 )
         else:
             result_run = previous_run
@@ -120,9 +409,120 @@ class ChecksAPI:
             result_run.status = status
             result_run.state = state
             result_run.result = result or {}
+            result_run.input_digest = input_digest
 
         return result_run
 
+    @classmethod
+    def _register_run(cls, uow, run, new_runs=None, run_async=False):
+        """Register the write of a run, and of its async check if needed.
+
+        Runs in ``new_runs`` are written by :meth:`_upsert_check_runs` instead.
+        """
+        if new_runs is not None and run in new_runs:
+            new_runs[run] = new_runs[run] or run_async
+            return
+        uow.register(ModelCommitOp(run))
+        if run_async:
+            RunChecksTaskOp.add(uow, run)
+
+    @classmethod
+    def _upsert_check_runs(cls, new_runs, uow):
+        """Write new runs in a single statement, updating the ones that exist.
+
+        A run created by another request in the meantime is updated, and the new run
+        takes its id. Only for the databases in ``_upsert_inserts``. Returns the runs
+        of the session, by the new runs.
+        """
+        insert = cls._upsert_inserts[db.session.get_bind().dialect.name]
+        columns = [
+            "id",
+            "config_id",
+            "record_id",
+            "is_draft",
+            "revision_id",
+            "start_time",
+            "end_time",
+            "status",
+            "state",
+            "result",
+            "input_digest",
+        ]
+        stmt = insert(CheckRun.__table__).values(
+            [{column: getattr(run, column) for column in columns} for run in new_runs]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["config_id", "record_id", "is_draft"],
+            set_={
+                column: stmt.excluded[column] for column in columns[4:] + ["updated"]
+            },
+        ).returning(
+            CheckRun.__table__.c.id,
+            CheckRun.__table__.c.config_id,
+            CheckRun.__table__.c.is_draft,
+        )
+        ids = {
+            (config_id, is_draft): id_
+            for id_, config_id, is_draft in db.session.execute(stmt)
+        }
+
+        written = {}
+        for run, run_async in new_runs.items():
+            run.id = ids[(run.config_id, run.is_draft)]
+            # The row is written, so the run is added as already persistent. Merged,
+            # since the session may already have the run of another request.
+            make_transient_to_detached(run)
+            written[run] = db.session.merge(run, load=False)
+            if run_async:
+                RunChecksTaskOp.add(uow, run)
+        return written
+
+    @classmethod
+    def _insert_check_runs(cls, new_runs, record, uow):
+        """Write new runs one by one, when :meth:`_upsert_check_runs` failed.
+
+        Runs that fail to be written are logged and skipped. Returns the runs of the
+        session, or ``None`` for the skipped ones, by the new runs.
+        """
+        written = {}
+        for run, run_async in new_runs.items():
+            try:
+                written[run] = cls._create_or_update_check_run(
+                    run.config,
+                    record,
+                    None,
+                    run.is_draft,
+                    run.status,
+                    run.state,
+                    result=run.result,
+                    start_time=run.start_time,
+                    end_time=run.end_time,
+                    input_digest=run.input_digest,
+                )
+            except Exception:
+                current_app.logger.exception(
+                    "Error writing check run",
+                    extra={
+                        "check_config_id": str(run.config_id),
+                        "record_id": str(record.id),
+                    },
+                )
+                written[run] = None
+                continue
+            cls._register_run(uow, written[run], run_async=run_async)
+        return written
+
+    @classmethod
+    def _get_previous_run(cls, config, record, is_draft, runs=None):
+        """Get the run of a configuration on a record or draft, if any."""
+        if runs is not None:
+            return runs.get((config.id, is_draft))
+        return CheckRun.query.filter_by(
+            config_id=config.id,
+            record_id=record.id,
+            is_draft=is_draft,
+        ).one_or_none()
+
     @classmethod
     def get_target(cls, check_run):
         """Get the target object for a check run."""
@@ -145,7 +545,19 @@ class ChecksAPI:
 
     @classmethod
     def run_check(
-        cls, config, record, uow, is_draft=None, sync=False, started=None, **kwargs
+        cls,
+        config,
+        record,
+        uow,
+        is_draft=None,
+        sync=False,
+        started=None,
+        reuse_result=True,
+        runs=None,
+        new_runs=None,
+        deferred=None,
+        deadline=None,
+        **kwargs,
     ):
         """Run a check for a given configuration on a record or draft.
 
@@ -155,6 +567,24 @@ class ChecksAPI:
 
         ``started`` is the `start_time` a worker wrote on the run. Its result is
         stored only while the row still has that value.
+
+        With ``reuse_result``, a completed run whose ``input_digest`` matches the one
+        of the record is kept as is, without running the check.
+
+        ``runs`` are the runs of the record already loaded by :meth:`run_checks`,
+        indexed by ``(config_id, is_draft)``. The previous runs are taken from them
+        instead of being queried.
+
+        ``new_runs`` collects the runs to create, which are then written together by
+        :meth:`run_checks`.
+
+        With ``deferred``, a sync check that is ``thread_safe`` is sent to the
+        executor instead, and ``None`` is returned. Its configuration, future and a
+        function storing its result are added to ``deferred``.
+
+        ``deadline`` is the :func:`time.monotonic` time by which the sync checks of
+        the save must be done. Past it, or if its previous run took longer than
+        ``CHECKS_SYNC_BUDGET_MS``, a sync check is run async instead.
         """
         if is_draft is None:
             # Only records have drafts. Everything else is stored with is_draft=False
@@ -171,21 +601,13 @@ class ChecksAPI:
             return None
 
         check_instance = check_cls()
-        previous_run = CheckRun.query.filter_by(
-            config_id=config.id,
-            record_id=record.id,
-            is_draft=is_draft,
-        ).one_or_none()
+        previous_run = cls._get_previous_run(config, record, is_draft, runs)
 
         if previous_run is None and is_draft:
             # A new draft starts from the published record's result, instead of
             # showing a pending run until the check has run again. should_rerun
             # decides below whether to keep it.
-            record_run = CheckRun.query.filter_by(
-                config_id=config.id,
-                record_id=record.id,
-                is_draft=False,
-            ).one_or_none()
+            record_run = cls._get_previous_run(config, record, False, runs)
             if record_run is not None and record_run.status == CheckRunStatus.COMPLETED:
                 previous_run = cls._create_or_update_check_run(
                     config,
@@ -197,17 +619,45 @@ class ChecksAPI:
                     result=record_run.result,
                     start_time=record_run.start_time,
                     end_time=record_run.end_time,
+                    input_digest=record_run.input_digest,
+                    new_runs=new_runs,
                 )
-                uow.register(ModelCommitOp(previous_run))
+                cls._register_run(uow, previous_run, new_runs)
+
+        # Reuse the result if the check already completed on the same inputs
+        context = check_instance.run_context(record, config)
+        input_digest = check_instance.input_digest(record, config, **context)
+        if (
+            reuse_result
+            and previous_run
+            and input_digest is not None
+            and previous_run.status == CheckRunStatus.COMPLETED
+            and previous_run.input_digest == input_digest
+        ):
+            previous_run.revision_id = record.revision_id
+            cls._register_run(uow, previous_run, new_runs)
+            current_checks_metrics.increment(
+                "checks_runs_skipped_total", check_id=config.check_id, reason="reused"
+            )
+            return previous_run
 
         if previous_run and not check_instance.should_rerun(
             record, config, previous_run, **kwargs
         ):
             previous_run.revision_id = record.revision_id
-            uow.register(ModelCommitOp(previous_run))
+            cls._register_run(uow, previous_run, new_runs)
+            current_checks_metrics.increment(
+                "checks_runs_skipped_total",
+                check_id=config.check_id,
+                reason="should_rerun",
+            )
             return previous_run
 
-        if getattr(check_cls, "sync", True) or sync:
+        run_sync = getattr(check_cls, "sync", True) or sync
+        if run_sync and not sync and cls._over_budget(config, previous_run, deadline):
+            run_sync = False
+
+        if run_sync:
             run_id = None
             if started is not None:
                 if previous_run is None:
@@ -228,8 +678,46 @@ class ChecksAPI:
                 # Read the id now, since the row can be deleted while the check runs.
                 run_id = previous_run.id
 
+            if started is None and deferred is not None and check_cls.thread_safe:
+                deferred.append(
+                    (
+                        config,
+                        cls._submit_run(
+                            check_instance, record, config, **context, **kwargs
+                        ),
+                        functools.partial(
+                            cls._store_result,
+                            config,
+                            record,
+                            uow,
+                            previous_run,
+                            is_draft,
+                            input_digest=input_digest,
+                            new_runs=new_runs,
+                        ),
+                        functools.partial(
+                            cls._queue_run,
+                            config,
+                            record,
+                            uow,
+                            previous_run,
+                            is_draft,
+                            check_instance,
+                            new_runs=new_runs,
+                        ),
+                    )
+                )
+                return None
+
             start_time = started or datetime.now(timezone.utc)
-            res, state = check_instance.run(record, config, **kwargs)
+            res, state = cls._timed_run(
+                check_instance,
+                record,
+                config,
+                "async" if sync else "sync",
+                **context,
+                **kwargs,
+            )
             end_time = datetime.now(timezone.utc)
 
             if started is not None:
@@ -245,6 +733,7 @@ class ChecksAPI:
                         "result": res.to_dict(),
                         "end_time": end_time,
                         "revision_id": record.revision_id,
+                        "input_digest": input_digest,
                     },
                     synchronize_session=False,
                 )
@@ -256,20 +745,58 @@ class ChecksAPI:
                     return None
                 return previous_run
 
-            result_run = cls._create_or_update_check_run(
+            result_run = cls._store_result(
                 config,
                 record,
+                uow,
                 previous_run,
                 is_draft,
-                CheckRunStatus.COMPLETED,
-                state=state,
-                result=res.to_dict(),
-                start_time=start_time,
-                end_time=end_time,
+                res,
+                state,
+                start_time,
+                end_time,
+                input_digest=input_digest,
+                new_runs=new_runs,
             )
-            uow.register(ModelCommitOp(result_run))
+            if not sync:
+                cls._count_sync_run(config)
             return result_run
 
+        return cls._queue_run(
+            config,
+            record,
+            uow,
+            previous_run,
+            is_draft,
+            check_instance,
+            new_runs=new_runs,
+        )
+
+    @classmethod
+    def _over_budget(cls, config, previous_run, deadline):
+        """Whether a sync check does not fit in the time left for the save."""
+        if deadline is None:
+            return False
+        budget = timedelta(milliseconds=current_app.config[cls._sync_budget_cfg])
+        if time.monotonic() >= deadline:
+            reason = "Sync checks budget spent, running check async"
+        elif (
+            previous_run is not None
+            and previous_run.start_time is not None
+            and previous_run.end_time is not None
+            and previous_run.end_time - previous_run.start_time > budget
+        ):
+            reason = "Check took longer than the sync budget, running it async"
+        else:
+            return False
+        current_app.logger.info(reason, extra={"check_config_id": str(config.id)})
+        return True
+
+    @classmethod
+    def _queue_run(
+        cls, config, record, uow, previous_run, is_draft, check_instance, new_runs=None
+    ):
+        """Mark the run of a check as pending, to be run by a worker."""
         result_run = cls._create_or_update_check_run(
             config,
             record,
@@ -278,11 +805,206 @@ class ChecksAPI:
             CheckRunStatus.PENDING,
             state=previous_run.state if previous_run else {},
             result=check_instance.pending_result(config.params),
+            new_runs=new_runs,
+        )
+        cls._register_run(uow, result_run, new_runs, run_async=True)
+        current_checks_metrics.increment(
+            "checks_runs_total", check_id=config.check_id, mode="async"
+        )
+        return result_run
+
+    @classmethod
+    def _count_sync_run(cls, config):
+        """Count a check run on the save, once its result is stored."""
+        current_checks_metrics.increment(
+            "checks_runs_total", check_id=config.check_id, mode="sync"
+        )
+
+    @classmethod
+    def _timed_run(cls, check_instance, record, config, mode, **kwargs):
+        """Run a check, adding its duration to the metrics."""
+        with current_checks_metrics.timer(
+            "checks_run_duration_seconds",
+            check_id=config.check_id,
+            target_type=config.target_type,
+            mode=mode,
+        ):
+            return check_instance.run(record, config, **kwargs)
+
+    @classmethod
+    def _store_result(
+        cls,
+        config,
+        record,
+        uow,
+        previous_run,
+        is_draft,
+        res,
+        state,
+        start_time,
+        end_time,
+        input_digest=None,
+        new_runs=None,
+    ):
+        """Store the result of a sync check in its run."""
+        result_run = cls._create_or_update_check_run(
+            config,
+            record,
+            previous_run,
+            is_draft,
+            CheckRunStatus.COMPLETED,
+            state=state,
+            result=res.to_dict(),
+            start_time=start_time,
+            end_time=end_time,
+            input_digest=input_digest,
+            new_runs=new_runs,
         )
-        uow.register(ModelCommitOp(result_run))
-        uow.register(TaskOp(run_check_async, str(result_run.id)))
+        cls._register_run(uow, result_run, new_runs)
         return result_run
 
+    @classmethod
+    def _submit_run(cls, check_instance, record, config, **kwargs):
+        """Run a check on the executor, in the app and request context of the caller.
+
+        The configuration was already loaded by the caller, so the thread does not
+        use the database session of the request.
+        """
+        app = current_app._get_current_object()
+
+        def run():
+            start_time = datetime.now(timezone.utc)
+            res, state = cls._timed_run(
+                check_instance, record, config, "sync", **kwargs
+            )
+            return res, state, start_time, datetime.now(timezone.utc)
+
+        if has_request_context():
+            return cls.executor.submit(copy_current_request_context(run))
+
+        def run_in_app_context():
+            with app.app_context():
+                return run()
+
+        return cls.executor.submit(run_in_app_context)
+
+    @classproperty
+    @functools.cache
+    def executor(cls) -> ThreadPoolExecutor:
+        """Get the thread pool running the thread-safe sync checks."""
+        return ThreadPoolExecutor(
+            max_workers=current_app.config[cls._executor_workers_cfg],
+            thread_name_prefix="invenio-checks",
+        )
+
+    @classmethod
+    def run_checks(cls, configs, record, uow, runs=None, bulk=False, **kwargs):
+        """Run the checks of many configurations on a record or draft.
+
+        The runs of the record, both of its draft and of its published version, are
+        loaded in a single query instead of once per configuration. Pass them as
+        ``runs`` if they are already loaded. Checks that fail are logged and skipped.
+        Returns the runs that were created or updated.
+
+        With ``bulk``, e.g. during imports, the async checks of the unit of work are
+        sent with the priority of bulk work instead of the interactive one.
+
+        With ``CHECKS_SYNC_EXECUTOR_WORKERS``, the sync checks that are
+        ``thread_safe`` run concurrently on a thread pool. Their results are stored
+        in the unit of work once they all finished.
+
+        With ``CHECKS_SYNC_BUDGET_MS``, the sync checks that would make the save take
+        longer are run async instead. A check on the thread pool that is not done in
+        time is left to finish there, and its result discarded.
+
+        On PostgreSQL and SQLite, the new runs are written in a single
+        ``INSERT ... ON CONFLICT DO UPDATE`` statement on the unique constraint of
+        the runs, instead of one ``INSERT`` in its own savepoint each. If that
+        statement fails, they are written one by one, skipping the failing ones.
+        """
+        if bulk:
+            RunChecksTaskOp.get(uow).bulk = True
+        if runs is None:
+            runs = CheckRun.query.filter_by(record_id=record.id).all()
+        runs_index = {(run.config_id, run.is_draft): run for run in runs}
+        dialect = db.session.get_bind().dialect.name
+        new_runs = {} if dialect in cls._upsert_inserts else None
+        parallel = (
+            current_app.config.get(cls._executor_workers_cfg) and len(configs) > 1
+        )
+        deferred = [] if parallel else None
+        budget = current_app.config.get(cls._sync_budget_cfg)
+        deadline = time.monotonic() + budget / 1000 if budget else None
+
+        results = []
+        for config in configs:
+            try:
+                run = cls.run_check(
+                    config,
+                    record,
+                    uow,
+                    runs=runs_index,
+                    new_runs=new_runs,
+                    deferred=deferred,
+                    deadline=deadline,
+                    **kwargs,
+                )
+            except Exception:
+                current_app.logger.exception(
+                    "Error running check",
+                    extra={
+                        "check_config_id": str(config.id),
+                        "record_id": str(record.id),
+                    },
+                )
+                continue
+            if run:
+                runs_index[(config.id, run.is_draft)] = run
+                results.append(run)
+
+        for config, future, store, queue in deferred or []:
+            try:
+                timeout = None
+                if deadline is not None:
+                    timeout = max(deadline - time.monotonic(), 0)
+                try:
+                    run = store(*future.result(timeout=timeout))
+                    cls._count_sync_run(config)
+                except FuturesTimeoutError:
+                    future.cancel()
+                    current_app.logger.info(
+                        "Check not done within the sync budget, running it async",
+                        extra={"check_config_id": str(config.id)},
+                    )
+                    run = queue()
+            except Exception:
+                current_app.logger.exception(
+                    "Error running check",
+                    extra={
+                        "check_config_id": str(config.id),
+                        "record_id": str(record.id),
+                    },
+                )
+                continue
+            runs_index[(config.id, run.is_draft)] = run
+            results.append(run)
+
+        if new_runs:
+            try:
+                # In a nested transaction, so a failed statement can be retried
+                # run by run.
+                with db.session.begin_nested():
+                    written = cls._upsert_check_runs(new_runs, uow)
+            except Exception:
+                current_app.logger.exception(
+                    "Error writing check runs, writing them one by one",
+                    extra={"record_id": str(record.id)},
+                )
+                written = cls._insert_check_runs(new_runs, record, uow)
+            results = [written.get(run, run) for run in results]
+            results = [run for run in results if run is not None]
+        return results
+
     @classmethod
     def extract_run_errors(cls, runs):
         """Build errors list from a list of check runs."""
@@ -354,6 +1076,7 @@ class ChecksAPI:
                     target,
                     uow,
                     is_draft=check_run.is_draft,
+                    reuse_result=False,
                 )
                 uow.commit()
 
@@ -2,12 +2,17 @@
 # SPDX-License-Identifier: MIT
 """Check implementations and registry."""
 
+import hashlib
+import json
 from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, List
 
+from celery.utils.time import get_exponential_backoff_interval
 from invenio_base.utils import entry_points
 from invenio_communities.proxies import current_communities
 
+from .utils import translate_field
+
 
 @dataclass
 class CheckResult:
@@ -43,6 +48,40 @@ class Check:
     sync: bool
     """Whether the check should run synchronously"""
 
+    debounce: int = 0
+    """Seconds to wait before running the check asynchronously.
+
+    The saves of a draft during that time lead to a single run of the check.
+    """
+
+    soft_time_limit: int = 120
+    """Seconds after which an async run of the check is interrupted."""
+
+    time_limit: int = 180
+    """Seconds after which the worker of an async run of the check is killed."""
+
+    max_retries: int = 3
+    """How many times a failed async run of the check is retried."""
+
+    retry_backoff: int = 10
+    """Seconds before the first retry, doubled on each of the next ones."""
+
+    retry_backoff_max: int = 600
+    """Most seconds before a retry."""
+
+    retry_jitter: bool = True
+    """Wait a random time up to the backoff, so that retries are spread out."""
+
+    non_retryable_exceptions: tuple = ()
+    """Exceptions of the check that fail its run without retries."""
+
+    thread_safe: bool = False
+    """Whether ``run`` may run in another thread, concurrently with other checks.
+
+    It then gets the app and request context of the caller, but must not use the
+    database session.
+    """
+
     allow_rerun: bool = False
     """Whether the check can be manually re-run by the user."""
 
@@ -52,6 +91,18 @@ class Check:
     hide_parent_checks: bool = False
     """Whether to display only check runs of the exact community or also show parent's check runs."""
 
+    @classmethod
+    def time_limits(cls):
+        """Get the Celery time limits of the async runs of the check."""
+        return {"soft_time_limit": cls.soft_time_limit, "time_limit": cls.time_limit}
+
+    @classmethod
+    def retry_countdown(cls, retries):
+        """Get the seconds to wait before retrying an async run."""
+        return get_exponential_backoff_interval(
+            cls.retry_backoff, retries, cls.retry_backoff_max, cls.retry_jitter
+        )
+
     def validate_config(self, config):
         """Validate the configuration for this check."""
         raise NotImplementedError()
@@ -61,11 +112,15 @@ class Check:
         raise NotImplementedError()
 
     def pending_result(self, params):
-        """Return the initial result dict stored while the check is pending."""
+        """Return the initial result dict stored while the check is pending.
+
+        The result is stored as JSON, so the lazy title and description are
+        translated to plain strings.
+        """
         return {
             "id": self.id,
-            "title": self.title,
-            "description": self.description,
+            "title": translate_field(self.title),
+            "description": translate_field(self.description),
         }
 
     @classmethod
@@ -77,6 +132,49 @@ class Check:
         """Allows a Check class to define whether to rerun a check. True by default."""
         return True
 
+    def run_context(self, record, config):
+        """Get keyword arguments for ``input_fingerprint`` and ``run`` on a record.
+
+        They are passed to both, e.g. to share the lookups of the record between
+        them. Empty by default.
+        """
+        return {}
+
+    def input_fingerprint(self, record, config, **kwargs):
+        """Get the parts of the record that the result of the check depends on.
+
+        The result must be JSON serializable. Returning ``None`` (the default) means
+        that the inputs are not known, and the check always runs. ``kwargs`` are the
+        ones of :meth:`run_context`.
+        """
+        return None
+
+    def input_digest(self, record, config, **kwargs):
+        """Get a digest of the record fingerprint and of the configuration.
+
+        A completed run with the same digest is reused instead of running the check
+        again. Returns ``None`` if the check has no input fingerprint, or if it is not
+        JSON serializable, since the digest would then not follow its content.
+        """
+        fingerprint = self.input_fingerprint(record, config, **kwargs)
+        if fingerprint is None:
+            return None
+
+        severity = getattr(config, "severity", None)
+        try:
+            data = json.dumps(
+                {
+                    "check_id": self.id,
+                    "params": config.params,
+                    "severity": getattr(severity, "value", severity),
+                    "input": fingerprint,
+                },
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
 
 class ChecksRegistry:
     """Registry for check classes."""
@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Check configurations cache."""
+
+import copy
+import threading
+import time
+import uuid
+from collections import namedtuple
+
+from flask import current_app
+from invenio_cache import current_cache
+from invenio_db import db
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+from .models import CheckConfig
+
+CacheEntry = namedtuple("CacheEntry", ["generation", "expires", "snapshots"])
+
+
+class ConfigsCache:
+    """Process-local read-through cache of the enabled check configurations.
+
+    Entries are keyed by ``(community_id, target_type)`` and hold the column values
+    of the configurations, which are turned back into instances of the current
+    session on each lookup. An entry is dropped after ``ttl`` seconds, or as soon as
+    the generation token shared by all processes through the cache changes. The
+    token is replaced after every commit that changed a check configuration, see
+    :func:`register_invalidation`.
+    """
+
+    generation_key = "invenio_checks:configs:generation"
+
+    def __init__(self, ttl=300):
+        """Initialize the cache."""
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def generation(cls):
+        """Get the current generation token."""
+        return current_cache.get(cls.generation_key)
+
+    @classmethod
+    def invalidate(cls):
+        """Drop the entries of all processes, by replacing the generation token."""
+        current_cache.set(cls.generation_key, uuid.uuid4().hex, timeout=0)
+
+    def get(self, community_id, target_type, load, generation=None):
+        """Get the configurations of a key, calling ``load()`` on a miss.
+
+        ``generation`` is the current token, if it was already read for the other
+        keys of a lookup.
+        """
+        if generation is None:
+            generation = self.generation()
+        key = (community_id, target_type)
+        with self._lock:
+            entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry.generation == generation
+            and entry.expires > time.monotonic()
+        ):
+            return [self._restore(snapshot) for snapshot in entry.snapshots]
+
+        configs = load()
+        snapshots = [self._snapshot(config) for config in configs]
+        with self._lock:
+            self._entries[key] = CacheEntry(
+                generation, time.monotonic() + self.ttl, snapshots
+            )
+        return configs
+
+    def clear(self):
+        """Remove all entries of this process."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _snapshot(config):
+        """Get the column values of a configuration."""
+        return {
+            column.key: getattr(config, column.key)
+            for column in CheckConfig.__mapper__.column_attrs
+        }
+
+    @staticmethod
+    def _restore(snapshot):
+        """Turn column values into a configuration of the current session."""
+        config = CheckConfig.__mapper__.class_manager.new_instance()
+        for key, value in snapshot.items():
+            setattr(config, key, copy.deepcopy(value))
+        make_transient_to_detached(config)
+        # Without `load`, the instance is attached as is, without a query. If the
+        # session already has the configuration, that instance is returned.
+        return db.session.merge(config, load=False)
+
+
+_changed_key = "invenio_checks_configs_changed"
+
+
+def _mark_changed(mapper, connection, target):
+    """Remember that the session changed a check configuration."""
+    session = object_session(target)
+    if session is not None:
+        session.info[_changed_key] = True
+
+
+def _after_commit(session):
+    """Invalidate the cached configurations once the changes are committed."""
+    changed = session.info.pop(_changed_key, False)
+    if changed and current_app.config.get("CHECKS_CONFIGS_CACHE_ENABLED", False):
+        ConfigsCache.invalidate()
+
+
+def _after_rollback(session):
+    """Forget the changes that were rolled back."""
+    session.info.pop(_changed_key, None)
+
+
+def register_invalidation():
+    """Invalidate the cached configurations whenever a configuration changes.
+
+    Changes made with bulk ``UPDATE`` or ``DELETE`` queries are not seen, and are
+    only picked up when the entries expire.
+    """
+    for name in ("after_insert", "after_update", "after_delete"):
+        if not event.contains(CheckConfig, name, _mark_changed):
+            event.listen(CheckConfig, name, _mark_changed)
+    if not event.contains(Session, "after_commit", _after_commit):
+        event.listen(Session, "after_commit", _after_commit)
+    if not event.contains(Session, "after_rollback", _after_rollback):
+        event.listen(Session, "after_rollback", _after_rollback)
@@ -55,28 +55,19 @@ class ChecksComponent(ServiceComponent):
         # Take into account already included communities
         community_ids = self._get_record_communities(draft)
 
-        # Take into account configs from past check runs (could be inclusion requests)
-        past_runs = ChecksAPI.get_runs(draft)
-        for run in past_runs:
-            if run.config.community_id is not None:
+        # Take into account configs from past check runs (could be inclusion requests).
+        # The record runs are loaded as well, for the checks to run below.
+        runs = (
+            CheckRun.query.options(ChecksAPI.config_loader())
+            .filter_by(record_id=draft.id)
+            .all()
+        )
+        for run in runs:
+            if run.is_draft == draft.is_draft and run.config.community_id is not None:
                 community_ids.add(str(run.config.community_id))
 
-        updated_runs = []
         configs = ChecksAPI.get_configs(community_ids, target_type="record")
-        for config in configs:
-            try:
-                run = ChecksAPI.run_check(config, draft, self.uow)
-            except Exception:
-                current_app.logger.exception(
-                    "Error running check on draft",
-                    extra={
-                        "check_config_id": str(config.id),
-                        "record_id": str(draft.id),
-                    },
-                )
-                continue
-            if run:
-                updated_runs.append(run)
+        updated_runs = ChecksAPI.run_checks(configs, draft, self.uow, runs=runs)
 
         errors.extend(ChecksAPI.extract_run_errors(updated_runs))
 
@@ -93,17 +84,7 @@ class ChecksComponent(ServiceComponent):
                 community_ids.add(str(run.config.community_id))
 
         configs = ChecksAPI.get_configs(community_ids, target_type="record")
-        for config in configs:
-            try:
-                ChecksAPI.run_check(config, draft, self.uow)
-            except Exception:
-                current_app.logger.exception(
-                    "Error running check on new version draft",
-                    extra={
-                        "check_config_id": str(config.id),
-                        "record_id": str(draft.id),
-                    },
-                )
+        ChecksAPI.run_checks(configs, draft, self.uow)
 
     def edit(self, identity, draft=None, record=None, **kwargs):
         """Run checks on draft edit."""
@@ -113,24 +94,18 @@ class ChecksComponent(ServiceComponent):
         # Take into account configs from past check runs (could be inclusion requests).
         # NOTE: we want both draft and record runs here, since we just care about
         # getting all the involved community IDs.
-        past_runs = CheckRun.query.filter_by(record_id=record.id).all()
+        past_runs = (
+            CheckRun.query.options(ChecksAPI.config_loader())
+            .filter_by(record_id=record.id)
+            .all()
+        )
         for run in past_runs:
             if run.config.community_id is not None:
                 community_ids.add(str(run.config.community_id))
 
         # Run checks for all relevant communities
         configs = ChecksAPI.get_configs(community_ids, target_type="record")
-        for config in configs:
-            try:
-                ChecksAPI.run_check(config, draft, self.uow)
-            except Exception:
-                current_app.logger.exception(
-                    "Error running check on draft edit",
-                    extra={
-                        "check_config_id": str(config.id),
-                        "record_id": str(draft.id),
-                    },
-                )
+        ChecksAPI.run_checks(configs, draft, self.uow, runs=past_runs)
 
     def publish(self, identity, draft=None, record=None, **kwargs):
         """Turn the draft runs into the published record's runs."""
@@ -169,7 +144,7 @@ class ChecksComponent(ServiceComponent):
 
     def delete_draft(self, identity, draft=None, record=None, force=False, **kwargs):
         """Delete all draft runs."""
-        draft_runs = ChecksAPI.get_runs(draft)
+        draft_runs = ChecksAPI.get_runs(draft, with_config=False)
         for draft_run in draft_runs:
             self.uow.register(ModelDeleteOp(draft_run))
 
@@ -200,18 +175,9 @@ class CommunityChecksComponent(ServiceComponent):
     def update(self, identity, data=None, record=None, **kwargs):
         """Rerun checks for subcommunity."""
         past_runs = ChecksAPI.get_runs(record, is_draft=False)
-        for run in past_runs:
-            config = run.config
-            try:
-                ChecksAPI.run_check(config, record, self.uow)
-            except Exception:
-                current_app.logger.exception(
-                    "Error running community check",
-                    extra={
-                        "check_config_id": str(config.id),
-                        "record_id": str(record.id),
-                    },
-                )
+        ChecksAPI.run_checks(
+            [run.config for run in past_runs], record, self.uow, runs=past_runs
+        )
 
 
 @toggle_on_feature_flag(config_key="CHECKS_SUBCOMMUNITY_ENABLED")
@@ -226,21 +192,18 @@ class CommunityMemberChecksComponent(ServiceComponent):
 
         community = Community.get_record(community_id)
         past_runs = ChecksAPI.get_runs(community, is_draft=False)
-        for run in past_runs:
-            config = run.config
-            if config.check_id == "subcommunity_member":
-                try:
-                    ChecksAPI.run_check(
-                        config, community, uow, deleted_member_id=deleted_member_id
-                    )
-                except Exception:
-                    current_app.logger.exception(
-                        "Error running membership check",
-                        extra={
-                            "check_config_id": str(config.id),
-                            "record_id": str(community_id),
-                        },
-                    )
+        configs = [
+            run.config
+            for run in past_runs
+            if run.config.check_id == "subcommunity_member"
+        ]
+        ChecksAPI.run_checks(
+            configs,
+            community,
+            uow,
+            runs=past_runs,
+            deleted_member_id=deleted_member_id,
+        )
 
     def accept_member_request(self, identity, record=None, **kwargs):
         """Rerun on invitation accepted."""
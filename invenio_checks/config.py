@@ -11,3 +11,68 @@ CHECKS_SUBCOMMUNITY_ENABLED = False
 
 CHECKS_RUN_STALE_AFTER = timedelta(seconds=900)
 """How long a PENDING or RUNNING check run may sit before it is failed."""
+
+CHECKS_RUN_STALE_BATCH_SIZE = 500
+"""How many stale check runs are failed in each transaction of the cleanup."""
+
+CHECKS_RECHECK_CHUNK_SIZE = 100
+"""How many check runs each task of a bulk re-check runs, in one transaction."""
+
+CHECKS_RECHECK_CONCURRENCY = 4
+"""How many tasks of a bulk re-check may run at the same time."""
+
+CHECKS_ASYNC_DEBOUNCE = {}
+"""Debounce windows of the async checks in seconds, by check id.
+
+Overrides the ``debounce`` attribute of the check classes.
+"""
+
+CHECKS_TASK_ROUTES = {}
+"""Celery options of the async tasks of the checks, by check id.
+
+The options are passed to ``apply_async``, e.g. ``{"file_formats": {"queue":
+"checks-files", "priority": 3}}``. The options of ``"*"`` apply to all checks.
+"""
+
+CHECKS_TASK_PRIORITIES = {"interactive": None, "bulk": None}
+"""Celery priority of the async checks of interactive saves and of bulk work.
+
+Whether a higher value means a higher priority depends on the broker. ``None`` sends
+the tasks without a priority.
+"""
+
+CHECKS_SYNC_EXECUTOR_WORKERS = 0
+"""Threads running the ``thread_safe`` sync checks of a save concurrently.
+
+``0`` runs all the sync checks one after the other.
+"""
+
+CHECKS_SYNC_BUDGET_MS = None
+"""Milliseconds the sync checks may add to a save, e.g. of a draft.
+
+Past it, the remaining sync checks are run async, as are the ones whose previous run
+took longer. ``None`` runs all sync checks during the save.
+"""
+
+CHECKS_RUNS_CONFIG_LOADER = "selectin"
+"""How the configurations of check runs read together are loaded.
+
+``"selectin"`` loads them with a second query, ``"joined"`` with a join in the query
+of the runs.
+"""
+
+CHECKS_CONFIGS_CACHE_ENABLED = False
+"""Cache the enabled check configurations of each community in every process.
+
+Changes to the configurations are picked up by all processes after their commit, as
+long as they share the cache of Invenio-Cache.
+"""
+
+CHECKS_CONFIGS_CACHE_TTL = 300
+"""Seconds after which a cached list of check configurations is loaded again."""
+
+CHECKS_METRICS_BACKEND = "invenio_checks.metrics:ChecksMetrics"
+"""Backend of the metrics of the check runs.
+
+A subclass of ``invenio_checks.metrics.ChecksMetrics``, which discards them.
+"""
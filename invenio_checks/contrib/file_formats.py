@@ -4,6 +4,7 @@
 """File formats check."""
 
 import functools
+import hashlib
 import json
 from collections import defaultdict
 from dataclasses import asdict, dataclass, field
@@ -30,21 +31,26 @@ class FileFormatSpec:
 
 
 class FileFormatDatabase(dict):
-    """Database of file formats."""
+    """Database of file formats.
 
-    def __init__(self, *args, **kwargs):
+    ``version`` identifies the data the formats were loaded from, e.g. a hash of the
+    data file.
+    """
+
+    def __init__(self, *args, version=None, **kwargs):
         """Initialize the database."""
         super().__init__(*args, **kwargs)
         self._ext_lookup = defaultdict(set)
+        self.version = version
 
     def get_by_extension(self, ext: str) -> set[str]:
         """Get file format IDs by extension."""
         return self._ext_lookup.get(ext, set())
 
     @classmethod
-    def load(cls, data: dict[str, dict]) -> "FileFormatDatabase":
+    def load(cls, data: dict[str, dict], version=None) -> "FileFormatDatabase":
         """Load file formats from a dictionary."""
-        res = cls()
+        res = cls(version=version)
         if not isinstance(data, dict):
             raise ValueError("Invalid data structure in known formats file")
         for ff_id, ff_data in data.items():
@@ -125,16 +131,27 @@ class FileFormatsCheck(Check):
         if not data_path.exists():
             raise FileNotFoundError(f"Known formats data file not found: {data_path}")
 
-        with data_path.open("r") as f:
-            if data_path.suffix == ".yaml":
-                data = yaml.safe_load(f)
-            elif data_path.suffix == ".json":
-                data = json.load(f)
-            else:
-                raise ValueError(
-                    f"Unsupported file format for known formats data file: {data_path}"
-                )
-            return FileFormatDatabase.load(data)
+        raw = data_path.read_bytes()
+        if data_path.suffix == ".yaml":
+            data = yaml.safe_load(raw)
+        elif data_path.suffix == ".json":
+            data = json.loads(raw)
+        else:
+            raise ValueError(
+                f"Unsupported file format for known formats data file: {data_path}"
+            )
+        return FileFormatDatabase.load(data, version=hashlib.sha256(raw).hexdigest())
+
+    def input_fingerprint(self, record, config):
+        """Get the keys of the record's files, from which their formats are taken.
+
+        The version of the known formats is included, so that the results are not
+        reused once the data file changes.
+        """
+        return {
+            "known_formats": self.known_formats.version,
+            "files": sorted(file.key for file in record.files.values()),
+        }
 
     def run(
         self,
@@ -7,6 +7,7 @@ from .expressions import (
     ComparisonExpression,
     Expression,
     ExpressionResult,
+    FieldCache,
     FieldExpression,
     ListExpression,
     LogicalExpression,
@@ -22,6 +23,7 @@ __all__ = (
     "RuleParser",
     "Expression",
     "ExpressionResult",
+    "FieldCache",
     "FieldExpression",
     "ComparisonExpression",
     "LogicalExpression",
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+"""Metadata check caches."""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class RulesCache:
+    """Process-local LRU cache of parsed rules per check configuration.
+
+    Entries are keyed by the configuration's ``id`` and ``updated`` timestamp. An
+    edited configuration has a newer ``updated``, so its next lookup is a miss and
+    replaces the old entry.
+    """
+
+    def __init__(self, maxsize=128):
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, config, parse):
+        """Get the rules of a configuration, calling ``parse(params)`` on a miss."""
+        if config.id is None or not self.maxsize:
+            # An unsaved configuration has nothing stable to be keyed on.
+            return parse(config.params)
+
+        key = (config.id, config.updated)
+        with self._lock:
+            entry = self._entries.get(config.id)
+            if entry is not None and entry[0] == key:
+                self._entries.move_to_end(config.id)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # Parse outside of the lock, so that a slow parse does not block lookups of
+        # other configurations. Two concurrent misses both parse, the last one wins.
+        rules = parse(config.params)
+        with self._lock:
+            self._entries[config.id] = (key, rules)
+            self._entries.move_to_end(config.id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return rules
+
+    def info(self):
+        """Get the cache statistics."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
@@ -4,17 +4,21 @@
 # SPDX-License-Identifier: MIT
 """Metadata check implementation."""
 
+import functools
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from typing import Dict, List
 
+from flask import current_app
 from invenio_i18n import gettext as _
 from invenio_i18n import lazy_gettext as _l
 
 from invenio_checks.base import Check, CheckResult
 from invenio_checks.models import CheckConfig
-from invenio_checks.utils import translate_field
+from invenio_checks.utils import classproperty, translate_field
 
+from .cache import RulesCache
+from .expressions import FieldCache
 from .rules import RuleParser, RuleResult
 
 
@@ -47,6 +51,70 @@ class MetadataCheck(Check):
     sort_order = 10
     sync = True
 
+    _rules_cache_size_cfg = "CHECKS_METADATA_RULES_CACHE_SIZE"
+    _short_circuit_cfg = "CHECKS_METADATA_SHORT_CIRCUIT"
+    _diagnostics_cfg = "CHECKS_METADATA_DIAGNOSTICS"
+
+    @classproperty
+    @functools.cache
+    def rules_cache(cls) -> RulesCache:
+        """Get the process-local cache of parsed rules."""
+        return RulesCache(
+            maxsize=current_app.config.get(cls._rules_cache_size_cfg, 128)
+        )
+
+    @staticmethod
+    def parse_rules(params):
+        """Parse the rules of the configuration params, skipping invalid ones."""
+        rules = []
+        for rule_config in params.get("rules", []):
+            try:
+                rules.append(RuleParser.parse(rule_config))
+            except Exception:
+                # Skip this rule
+                continue
+        return rules
+
+    def field_reads(self, config):
+        """Get the record fields read by the rules of a configuration.
+
+        Returns ``(reader, path)`` pairs, or ``None`` if they are not known for one
+        of the rules.
+        """
+        reads = set()
+        for rule in self.rules_cache.get(config, self.parse_rules):
+            rule_reads = rule.field_reads()
+            if rule_reads is None:
+                return None
+            reads |= rule_reads
+        return reads
+
+    def run_context(self, record, config):
+        """Share the field lookups of the input fingerprint with the run."""
+        return {"fields": FieldCache(record)}
+
+    def input_fingerprint(self, record, config, fields=None, **kwargs):
+        """Get the values of the record fields read by the rules.
+
+        Each field is read the way its rules read it, in the :class:`FieldCache`
+        ``fields`` that the run of the check then reuses. Returns ``None`` if the
+        fields are not known.
+        """
+        reads = self.field_reads(config)
+        if reads is None:
+            return None
+
+        if fields is None:
+            fields = FieldCache(record)
+        values = []
+        for reader, path in sorted(reads, key=lambda read: (read[1], read[0].__name__)):
+            try:
+                value = fields.resolve_deref(reader, record, tuple(path.split(".")))
+                values.append([path, True, value])
+            except (KeyError, IndexError, TypeError):
+                values.append([path, False, None])
+        return values
+
     def validate_config(self, config):
         """Validate the configuration for this metadata check."""
         if not isinstance(config, dict):
@@ -70,9 +138,14 @@ class MetadataCheck(Check):
         record,
         config: CheckConfig,
         previous_run=None,
+        fields=None,
         **kwargs,
     ):
-        """Run the metadata check on a record with the given configuration."""
+        """Run the metadata check on a record with the given configuration.
+
+        ``fields`` is the :class:`FieldCache` of the record from :meth:`run_context`,
+        shared with the input fingerprint.
+        """
         # Create a check result
         result = MetadataCheckResult(
             self.id,
@@ -80,24 +153,29 @@ class MetadataCheck(Check):
             description=translate_field(self.description),
         )
 
-        # Parse the rules from the configuration
-        rules = []
-        for rule_config in config.params.get("rules", []):
-            try:
-                rule = RuleParser.parse(rule_config)
-                rules.append(rule)
-            except Exception:
-                # Skip this rule
-                continue
+        # Parse the rules from the configuration, or reuse the already parsed ones
+        rules = self.rules_cache.get(config, self.parse_rules)
 
         # If we have no valid rules, return early
         if not rules:
-            return result
-
-        # Evaluate each rule
+            return result, {}
+
+        # Evaluate each rule, sharing the field lookups between them, and with the
+        # input digest computed just before on the same record
+        if fields is None:
+            fields = FieldCache(record)
+        short_circuit = current_app.config.get(self._short_circuit_cfg, False)
+        # Without diagnostics, a failing rule only reports its checks up to the first
+        # failing one in the short-circuit mode
+        diagnostics = current_app.config.get(self._diagnostics_cfg, True)
         for rule in rules:
             try:
-                rule_result = rule.evaluate(record)
+                rule_result = rule.evaluate(
+                    record,
+                    fields=fields,
+                    short_circuit=short_circuit,
+                    diagnostics=diagnostics,
+                )
                 errors = self.to_service_errors(rule_result)
                 result.add_rule_result(rule_result)
                 result.add_errors(errors)
@@ -149,17 +227,26 @@ class MetadataCheckConfig:
 
         return cls(check_id, title, description, rules)
 
-    def evaluate(self, record):
-        """Evaluate the check against a record."""
+    def evaluate(self, record, short_circuit=False, diagnostics=True):
+        """Evaluate the check against a record.
+
+        See :meth:`Rule.evaluate` for ``short_circuit`` and ``diagnostics``.
+        """
         # Create a check result
         result = MetadataCheckResult(
             self.id, title=self.title, description=self.description
         )
 
-        # Evaluate each rule
+        # Evaluate each rule, sharing the field lookups between them
+        fields = FieldCache(record)
         for rule in self.rules:
             try:
-                rule_result = rule.evaluate(record)
+                rule_result = rule.evaluate(
+                    record,
+                    fields=fields,
+                    short_circuit=short_circuit,
+                    diagnostics=diagnostics,
+                )
                 result.add_rule_result(rule_result)
             except Exception:
                 pass
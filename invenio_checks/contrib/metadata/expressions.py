@@ -4,6 +4,8 @@
 
 """Metadata check expression engine."""
 
+import functools
+import inspect
 from dataclasses import dataclass, field
 from types import GeneratorType
 from typing import Optional
@@ -25,13 +27,178 @@ class ExpressionResult:
     message: Optional[str] = field(default=None)
 
 
+class AffixTrie:
+    """Trie of prefixes, or of suffixes, of strings.
+
+    Matching a value walks the trie once along the value, so the cost depends on
+    the length of the value and not on the number of prefixes or suffixes.
+    """
+
+    _END = None
+
+    def __init__(self, affixes, suffix=False):
+        """Build the trie."""
+        self.suffix = suffix
+        self._root = {}
+        for affix in affixes:
+            if not isinstance(affix, str):
+                raise ValueError(f"Prefixes and suffixes must be strings: {affix!r}")
+            node = self._root
+            for char in reversed(affix) if suffix else affix:
+                node = node.setdefault(char, {})
+            node[self._END] = True
+
+    def match(self, value):
+        """Check if the value starts (or ends) with any of the affixes."""
+        node = self._root
+        if self._END in node:
+            return True
+        for char in reversed(value) if self.suffix else value:
+            node = node.get(char)
+            if node is None:
+                return False
+            if self._END in node:
+                return True
+        return False
+
+
+class FieldCache:
+    """Memo of the field lookups on one record, shared by all rules of a check run.
+
+    Values are memoized per path prefix, so ``a.b`` and ``a.b.c`` share the walk to
+    ``a.b`` and a relation on the way is dereferenced at most once. Field and list
+    expressions read paths differently, so each keeps its own entries.
+    """
+
+    _LOOKUP_ERRORS = (KeyError, IndexError, TypeError)
+
+    def __init__(self, record):
+        """Initialize the cache for a record."""
+        self.record = record
+        # (expression class, path prefix) -> value, or the raised lookup error
+        self._values = {}
+        # (expression class, path prefix) -> dereferenced value, to walk further
+        self._parents = {}
+
+    def resolve(self, expr_cls, record, parts):
+        """Get a nested field like ``expr_cls._resolve`` does, memoized."""
+        if record is not self.record:
+            # E.g. the items of a list expression
+            return expr_cls._resolve(record, parts)
+
+        value = self._values.get((expr_cls, parts))
+        if value is None and (expr_cls, parts) not in self._values:
+            value = self._walk(expr_cls, parts)
+        if isinstance(value, self._LOOKUP_ERRORS):
+            raise value
+        return value
+
+    def resolve_deref(self, expr_cls, record, parts):
+        """Get a nested field like :meth:`resolve`, passed through ``_deref``.
+
+        The dereferenced value is memoized too, and reused to walk longer paths.
+        """
+        value = self.resolve(expr_cls, record, parts)
+        if record is not self.record or isinstance(value, GeneratorType):
+            return expr_cls._deref(value)
+        key = (expr_cls, parts)
+        if key not in self._parents:
+            self._parents[key] = expr_cls._deref(value)
+        return self._parents[key]
+
+    def _walk(self, expr_cls, parts):
+        """Walk to a path from its longest already walked prefix."""
+        start = len(parts) - 1
+        while start > 0:
+            key = (expr_cls, parts[:start])
+            if key in self._parents:
+                break
+            value = self._values.get(key)
+            if key in self._values and not isinstance(value, self._LOOKUP_ERRORS):
+                # Looked up before as a leaf, and not walked through yet
+                self._parents[key] = expr_cls._deref(value)
+                break
+            start -= 1
+        if start == 0 and (expr_cls, ()) not in self._parents:
+            self._parents[(expr_cls, ())] = expr_cls._deref(self.record)
+
+        obj = self._parents[(expr_cls, parts[:start])]
+        for i in range(start, len(parts)):
+            prefix = parts[: i + 1]
+            try:
+                value = expr_cls._step(obj, parts[i])
+            except self._LOOKUP_ERRORS as e:
+                value = e
+                break
+            if isinstance(value, GeneratorType):
+                # A generator can only be consumed once, so it is not shared.
+                if i + 1 < len(parts):
+                    obj = expr_cls._deref(value)
+                continue
+            self._values[(expr_cls, prefix)] = value
+            if i + 1 < len(parts):
+                obj = self._parents[(expr_cls, prefix)] = expr_cls._deref(value)
+
+        if not isinstance(value, GeneratorType):
+            self._values[(expr_cls, parts)] = value
+        return value
+
+
+def _takes_fields(evaluate):
+    """Get ``evaluate`` as a function of ``(record, fields=None)``.
+
+    Custom expressions whose ``evaluate`` only takes the record are called without
+    ``fields``.
+    """
+    try:
+        inspect.signature(evaluate).bind(None, None)
+    except TypeError:
+        return lambda record, fields=None: evaluate(record)
+    return evaluate
+
+
 class Expression:
     """Base class for all rule expressions."""
 
-    def evaluate(self, record):
-        """Evaluate the expression against a record."""
+    def evaluate(self, record, fields=None):
+        """Evaluate the expression against a record.
+
+        ``fields`` is an optional :class:`FieldCache` of the record, shared with the
+        other expressions evaluated against it.
+        """
         raise NotImplementedError()
 
+    def compile(self, short_circuit=False):
+        """Compile the expression into a function of ``(record, fields=None)``.
+
+        The returned function gives the same results as ``evaluate``, but resolves
+        the operators, paths and sub-expressions only once. With ``short_circuit``,
+        logical and list expressions stop at the first result deciding the outcome.
+
+        Custom expressions whose ``evaluate`` only takes the record are called
+        without ``fields``.
+        """
+        return _takes_fields(self.evaluate)
+
+    def field_reads(self):
+        """Get the record fields the expression reads, as ``(reader, path)`` pairs.
+
+        ``reader`` is the expression class whose lookups read the path, e.g. in a
+        :class:`FieldCache`. Returns ``None`` if they are not known, e.g. for custom
+        expressions.
+        """
+        return None
+
+    def field_paths(self):
+        """Get the paths of the record fields the expression reads.
+
+        Returns ``None`` if they are not known, e.g. for custom expressions.
+        """
+        reads = self.field_reads()
+        if reads is None:
+            return None
+        return {path for _, path in reads}
+
 
 class FieldExpression(Expression):
     """Expression for accessing a field in the record."""
@@ -43,10 +210,27 @@ class FieldExpression(Expression):
         """Initialize the expression."""
         self.field_path = field_path
 
-    def evaluate(self, record):
+    def evaluate(self, record, fields=None):
         """Access the field from the record."""
+        return self._evaluate(record, fields, parts=tuple(self.field_path.split(".")))
+
+    def compile(self, short_circuit=False):
+        """Compile the field access, splitting the path only once."""
+        return functools.partial(
+            self._evaluate, parts=tuple(self.field_path.split("."))
+        )
+
+    def field_reads(self):
+        """Get the path of the field."""
+        return {(FieldExpression, self.field_path)}
+
+    def _evaluate(self, record, fields=None, *, parts):
+        """Access the field from the record, given the split path."""
         try:
-            value = self._get_nested_field(record, self.field_path)
+            if fields is not None:
+                value = fields.resolve(FieldExpression, record, parts)
+            else:
+                value = self._resolve(record, parts)
             return ExpressionResult(True, self.field_path, value)
         except (KeyError, IndexError, TypeError):
             return ExpressionResult(
@@ -58,33 +242,44 @@ class FieldExpression(Expression):
 
     def _get_nested_field(self, obj, path):
         """Get a nested field from an object using dot notation."""
-        parts = path.split(".")
+        return self._resolve(obj, path.split("."))
+
+    @classmethod
+    def _resolve(cls, obj, parts):
+        """Get a nested field from an object, given the split path."""
         for part in parts:
-            if isinstance(obj, RelationResult):
-                obj = obj()
-            if isinstance(obj, GeneratorType):
-                obj = list(obj)
-
-            if isinstance(obj, dict):
-                if part in obj:
-                    obj = obj[part]
-                elif hasattr(obj, part):
-                    obj = getattr(obj, part)
-                else:
-                    raise KeyError(f"Key '{part}' not found")
-            elif hasattr(obj, part):
-                obj = getattr(obj, part)
-            elif isinstance(obj, list):
-                if not part.isdigit():
-                    raise KeyError(f"Invalid list index: {part}")
-                idx = int(part)
-                if idx >= len(obj):
-                    raise IndexError(f"List index out of range: {idx}")
-                obj = obj[idx]
-            else:
-                raise TypeError(f"Cannot access '{part}' on {type(obj)}")
+            obj = cls._step(cls._deref(obj), part)
+        return obj
+
+    @staticmethod
+    def _deref(obj):
+        """Turn a value into the object its next path part is read from."""
+        if isinstance(obj, RelationResult):
+            obj = obj()
+        if isinstance(obj, GeneratorType):
+            obj = list(obj)
         return obj
 
+    @staticmethod
+    def _step(obj, part):
+        """Get one path part of an object."""
+        if isinstance(obj, dict):
+            if part in obj:
+                return obj[part]
+            elif hasattr(obj, part):
+                return getattr(obj, part)
+            raise KeyError(f"Key '{part}' not found")
+        elif hasattr(obj, part):
+            return getattr(obj, part)
+        elif isinstance(obj, list):
+            if not part.isdigit():
+                raise KeyError(f"Invalid list index: {part}")
+            idx = int(part)
+            if idx >= len(obj):
+                raise IndexError(f"List index out of range: {idx}")
+            return obj[idx]
+        raise TypeError(f"Cannot access '{part}' on {type(obj)}")
+
 
 class ComparisonExpression(Expression):
     """Expression for comparing values."""
@@ -118,6 +313,22 @@ class ComparisonExpression(Expression):
         "max",
     ]
 
+    OPERATORS = {
+        "==": "_equal",
+        "!=": "_not_equal",
+        "~=": "_contains",
+        "!~=": "_not_contains",
+        "^=": "_starts_with",
+        "!^=": "_not_starts_with",
+        "$=": "_ends_with",
+        "!$=": "_not_ends_with",
+        "in": "_in",
+        "not in": "_not_in",
+        "min": "_check_min",
+        "max": "_check_max",
+    }
+    """Method implementing each operator, called with ``(left_value, path)``."""
+
     def __init__(self, left, operator, right):
         """Initialize the comparison."""
         self.left = left
@@ -129,11 +340,54 @@ class ComparisonExpression(Expression):
         self.operator = operator
 
         self.right = right
+        self._right_lookup = self._build_right_lookup(operator, right)
+
+    @staticmethod
+    def _build_right_lookup(operator, right):
+        """Build the lookup structure for a list on the right side, at parse time.
 
-    def evaluate(self, record):
+        Lists of values are turned into a frozenset for ``in``/``not in``, and lists
+        of prefixes or suffixes into a trie, so that large vocabularies do not make
+        the comparison slower.
+        """
+        if operator in ("in", "not in") and isinstance(right, list):
+            try:
+                return frozenset(right)
+            except TypeError:
+                # Unhashable items, e.g. dicts, are compared one by one
+                return None
+        if operator in ("^=", "!^=", "$=", "!$=") and isinstance(right, (list, tuple)):
+            return AffixTrie(right, suffix=operator in ("$=", "!$="))
+        return None
+
+    def evaluate(self, record, fields=None):
         """Evaluate the comparison."""
+        return self._evaluate(
+            record,
+            fields,
+            left=_takes_fields(self.left.evaluate),
+            operator=self._get_operator(),
+        )
+
+    def compile(self, short_circuit=False):
+        """Compile the comparison, resolving the operator only once."""
+        return functools.partial(
+            self._evaluate,
+            left=self.left.compile(short_circuit),
+            operator=self._get_operator(),
+        )
+
+    def field_reads(self):
+        """Get the fields read by the left side."""
+        return self.left.field_reads()
+
+    def _evaluate(self, record, fields=None, *, left, operator):
+        """Evaluate the comparison, given the left side and the operator method."""
         # Evaluate the left expression
-        left_result = self.left.evaluate(record)
+        return self._compare(left(record, fields), operator)
+
+    def _compare(self, left_result, operator):
+        """Compare the result of the left expression with the operator method."""
         if not left_result.success:
             return left_result
 
@@ -142,154 +396,181 @@ class ComparisonExpression(Expression):
         left_value = left_result.value
 
         # Perform the comparison
-        if self.operator == "==":
-            success = left_value == self.right
-            message = (
-                None
-                if success
-                else self.NOT_EQUAL.format(
-                    path=path, expected=self.right, actual=left_value
-                )
+        success, message = operator(left_value, path)
+        return ExpressionResult(success, path, left_value, message)
+
+    def _get_operator(self):
+        """Get the method implementing the operator."""
+        method_name = self.OPERATORS.get(self.operator)
+        if method_name is None:
+            return self._unknown_operator
+        return getattr(self, method_name)
+
+    def _unknown_operator(self, left_value, path):
+        """Fail for an operator without an implementation."""
+        return False, _("Unknown operator: {operator}").format(operator=self.operator)
+
+    def _equal(self, left_value, path):
+        """Check if the value is equal to the right side."""
+        success = left_value == self.right
+        message = (
+            None
+            if success
+            else self.NOT_EQUAL.format(
+                path=path, expected=self.right, actual=left_value
             )
-        elif self.operator == "!=":
-            success = left_value != self.right
-            message = (
-                None
-                if success
-                else self.EQUAL.format(
-                    path=path, unexpected=self.right, actual=left_value
-                )
+        )
+        return success, message
+
+    def _not_equal(self, left_value, path):
+        """Check if the value is not equal to the right side."""
+        success = left_value != self.right
+        message = (
+            None
+            if success
+            else self.EQUAL.format(path=path, unexpected=self.right, actual=left_value)
+        )
+        return success, message
+
+    def _contains(self, left_value, path):
+        """Check if the value contains the right side."""
+        if not isinstance(left_value, (list, dict, str)):
+            return False, _("Cannot check if {type} contains a value").format(
+                type=type(left_value)
             )
-        elif self.operator == "~=":
-            if isinstance(left_value, (list, dict, str)):
-                success = self.right in left_value
-                message = (
-                    None
-                    if success
-                    else self.NOT_CONTAINS.format(
-                        path=path, expected=self.right, actual=left_value
-                    )
-                )
-            else:
-                success = False
-                message = _("Cannot check if {type} contains a value").format(
-                    type=type(left_value)
-                )
-        elif self.operator == "!~=":
-            if isinstance(left_value, (list, dict, str)):
-                success = self.right not in left_value
-                message = (
-                    None
-                    if success
-                    else self.CONTAINS.format(
-                        path=path, unexpected=self.right, actual=left_value
-                    )
-                )
-            else:
-                success = False
-                message = _("Cannot check if {type} does not contain a value").format(
-                    type=type(left_value)
-                )
-        elif self.operator == "in":
-            if isinstance(self.right, (list, dict, str)):
-                success = left_value in self.right
-                message = (
-                    None
-                    if success
-                    else self.NOT_IN.format(
-                        path=path, expected=self.right, actual=left_value
-                    )
-                )
-            else:
-                success = False
-                message = _("Cannot check if {type} contains a value").format(
-                    type=type(self.right)
-                )
-        elif self.operator == "not in":
-            if isinstance(self.right, (list, dict, str)):
-                success = left_value not in self.right
-                message = (
-                    None
-                    if success
-                    else self.IN.format(
-                        path=path, unexpected=self.right, actual=left_value
-                    )
-                )
-            else:
-                success = False
-                message = _("Cannot check if {type} does not contain a value").format(
-                    type=type(self.right)
-                )
-        # Implement other operators as needed
-        elif self.operator == "^=":
-            if isinstance(left_value, str):
-                success = left_value.startswith(self.right)
-                message = (
-                    None
-                    if success
-                    else _("Expected {path} to start with {expected}").format(
-                        path=path, expected=self.right
-                    )
-                )
-            else:
-                success = False
-                message = _("Cannot check if {type} starts with a value").format(
-                    type=type(left_value)
-                )
-        elif self.operator == "!^=":
-            if isinstance(left_value, str):
-                success = not left_value.startswith(self.right)
-                message = (
-                    None
-                    if success
-                    else _("Expected {path} not to start with {unexpected}").format(
-                        path=path, unexpected=self.right
-                    )
-                )
-            else:
-                success = False
-                message = _("Cannot check if {type} doesn't start with a value").format(
-                    type=type(left_value)
-                )
-        elif self.operator == "$=":
-            if isinstance(left_value, str):
-                success = left_value.endswith(self.right)
-                message = (
-                    None
-                    if success
-                    else _("Expected {path} to end with {expected}").format(
-                        path=path, expected=self.right
-                    )
-                )
-            else:
-                success = False
-                message = _("Cannot check if {type} ends with a value").format(
-                    type=type(left_value)
-                )
-        elif self.operator == "!$=":
-            if isinstance(left_value, str):
-                success = not left_value.endswith(self.right)
-                message = (
-                    None
-                    if success
-                    else _("Expected {path} not to end with {unexpected}").format(
-                        path=path, unexpected=self.right
-                    )
-                )
-            else:
-                success = False
-                message = _("Cannot check if {type} doesn't end with a value").format(
-                    type=type(left_value)
-                )
-        elif self.operator == "min":
-            success, message = self._check_min(left_value, path)
-        elif self.operator == "max":
-            success, message = self._check_max(left_value, path)
-        else:
-            success = False
-            message = _("Unknown operator: {operator}").format(operator=self.operator)
+        success = self.right in left_value
+        message = (
+            None
+            if success
+            else self.NOT_CONTAINS.format(
+                path=path, expected=self.right, actual=left_value
+            )
+        )
+        return success, message
 
-        return ExpressionResult(success, path, left_value, message)
+    def _not_contains(self, left_value, path):
+        """Check if the value does not contain the right side."""
+        if not isinstance(left_value, (list, dict, str)):
+            return False, _("Cannot check if {type} does not contain a value").format(
+                type=type(left_value)
+            )
+        success = self.right not in left_value
+        message = (
+            None
+            if success
+            else self.CONTAINS.format(
+                path=path, unexpected=self.right, actual=left_value
+            )
+        )
+        return success, message
+
+    def _in(self, left_value, path):
+        """Check if the value is in the right side."""
+        if not isinstance(self.right, (list, dict, str)):
+            return False, _("Cannot check if {type} contains a value").format(
+                type=type(self.right)
+            )
+        success = self._is_in_right(left_value)
+        message = (
+            None
+            if success
+            else self.NOT_IN.format(path=path, expected=self.right, actual=left_value)
+        )
+        return success, message
+
+    def _not_in(self, left_value, path):
+        """Check if the value is not in the right side."""
+        if not isinstance(self.right, (list, dict, str)):
+            return False, _("Cannot check if {type} does not contain a value").format(
+                type=type(self.right)
+            )
+        success = not self._is_in_right(left_value)
+        message = (
+            None
+            if success
+            else self.IN.format(path=path, unexpected=self.right, actual=left_value)
+        )
+        return success, message
+
+    def _is_in_right(self, value):
+        """Check if the value is in the right side."""
+        if self._right_lookup is not None:
+            try:
+                return value in self._right_lookup
+            except TypeError:
+                # Unhashable values, e.g. lists, are compared one by one
+                pass
+        return value in self.right
+
+    def _has_affix(self, value, method):
+        """Check if the value starts (or ends) with the right side."""
+        if isinstance(self.right, (list, tuple)):
+            return self._right_lookup.match(value)
+        return method(self.right)
+
+    def _starts_with(self, left_value, path):
+        """Check if the value starts with the right side."""
+        if not isinstance(left_value, str):
+            return False, _("Cannot check if {type} starts with a value").format(
+                type=type(left_value)
+            )
+        success = self._has_affix(left_value, left_value.startswith)
+        message = (
+            None
+            if success
+            else _("Expected {path} to start with {expected}").format(
+                path=path, expected=self.right
+            )
+        )
+        return success, message
+
+    def _not_starts_with(self, left_value, path):
+        """Check if the value does not start with the right side."""
+        if not isinstance(left_value, str):
+            return False, _("Cannot check if {type} doesn't start with a value").format(
+                type=type(left_value)
+            )
+        success = not self._has_affix(left_value, left_value.startswith)
+        message = (
+            None
+            if success
+            else _("Expected {path} not to start with {unexpected}").format(
+                path=path, unexpected=self.right
+            )
+        )
+        return success, message
+
+    def _ends_with(self, left_value, path):
+        """Check if the value ends with the right side."""
+        if not isinstance(left_value, str):
+            return False, _("Cannot check if {type} ends with a value").format(
+                type=type(left_value)
+            )
+        success = self._has_affix(left_value, left_value.endswith)
+        message = (
+            None
+            if success
+            else _("Expected {path} to end with {expected}").format(
+                path=path, expected=self.right
+            )
+        )
+        return success, message
+
+    def _not_ends_with(self, left_value, path):
+        """Check if the value does not end with the right side."""
+        if not isinstance(left_value, str):
+            return False, _("Cannot check if {type} doesn't end with a value").format(
+                type=type(left_value)
+            )
+        success = not self._has_affix(left_value, left_value.endswith)
+        message = (
+            None
+            if success
+            else _("Expected {path} not to end with {unexpected}").format(
+                path=path, unexpected=self.right
+            )
+        )
+        return success, message
 
     def _get_comparable_value(self, value):
         """Get the comparable value for min/max checks based on type.
@@ -384,12 +665,55 @@ class LogicalExpression(Expression):
         self.operator = operator
         self.expressions = expressions
 
-    def evaluate(self, record):
+    def evaluate(self, record, fields=None):
         """Evaluate the logical expression."""
+        return self._evaluate(
+            record,
+            fields,
+            expressions=[_takes_fields(expr.evaluate) for expr in self.expressions],
+        )
+
+    def compile(self, short_circuit=False):
+        """Compile the logical expression and its sub-expressions."""
+        return functools.partial(
+            self._evaluate_short_circuit if short_circuit else self._evaluate,
+            expressions=tuple(expr.compile(short_circuit) for expr in self.expressions),
+        )
+
+    def _evaluate_short_circuit(self, record, fields=None, *, expressions):
+        """Evaluate the logical expression, stopping at the first deciding result.
+
+        The result is the same as the full evaluation, which also does not report
+        which sub-expressions failed.
+        """
+        if self.operator == "and":
+            return ExpressionResult(
+                all(expr(record, fields).success for expr in expressions)
+            )
+        elif self.operator == "or":
+            return ExpressionResult(
+                any(expr(record, fields).success for expr in expressions)
+            )
+        return self._evaluate(record, fields, expressions=expressions)
+
+    def _evaluate(self, record, fields=None, *, expressions):
+        """Evaluate the logical expression, given the sub-expression functions."""
         # NOTE: We're not short-circuiting the evaluation so that we can return
         # all failed expressions in the result
-        results = [expr.evaluate(record) for expr in self.expressions]
-
+        return self._combine([expr(record, fields) for expr in expressions])
+
+    def field_reads(self):
+        """Get the fields read by the sub-expressions."""
+        reads = set()
+        for expr in self.expressions:
+            expr_reads = expr.field_reads()
+            if expr_reads is None:
+                return None
+            reads |= expr_reads
+        return reads
+
+    def _combine(self, results):
+        """Combine the results of the sub-expressions."""
         if self.operator == "and":
             # For AND, success is True only if all expressions succeed
             failures = [r for r in results if not r.success]
@@ -436,10 +760,43 @@ class ListExpression(Expression):
         if operator != "exists":
             self.predicate = predicate
 
-    def evaluate(self, record):
+    def evaluate(self, record, fields=None):
         """Evaluate the list expression."""
+        predicate = (
+            _takes_fields(self.predicate.evaluate)
+            if self.operator != "exists"
+            else None
+        )
+        return self._evaluate(
+            record, fields, parts=tuple(self.path.split(".")), predicate=predicate
+        )
+
+    def compile(self, short_circuit=False):
+        """Compile the list expression, splitting the path only once."""
+        predicate = (
+            self.predicate.compile(short_circuit) if self.operator != "exists" else None
+        )
+        return functools.partial(
+            self._evaluate,
+            parts=tuple(self.path.split(".")),
+            predicate=predicate,
+            short_circuit=short_circuit,
+        )
+
+    def field_reads(self):
+        """Get the path of the list.
+
+        The predicate reads the items, so the whole list is the dependency.
+        """
+        return {(ListExpression, self.path)}
+
+    def _evaluate(self, record, fields=None, *, parts, predicate, short_circuit=False):
+        """Evaluate the list expression, given the split path and the predicate."""
         try:
-            list_value = self._get_nested_field(record, self.path)
+            if fields is not None:
+                list_value = fields.resolve(ListExpression, record, parts)
+            else:
+                list_value = self._resolve(record, parts)
         except (KeyError, IndexError, TypeError):
             return ExpressionResult(
                 False,
@@ -487,7 +844,11 @@ class ListExpression(Expression):
                 )
 
         # Evaluate the predicate against each item
-        results = [self.predicate.evaluate(item) for item in list_value]
+        if short_circuit:
+            # Stop at the first item deciding the outcome
+            results = (predicate(item) for item in list_value)
+        else:
+            results = [predicate(item) for item in list_value]
 
         if self.operator == "any":
             success = any(r.success for r in results)
@@ -512,19 +873,33 @@ class ListExpression(Expression):
 
     def _get_nested_field(self, obj, path):
         """Get a nested field from an object using dot notation."""
-        parts = path.split(".")
+        return self._resolve(obj, path.split("."))
+
+    @classmethod
+    def _resolve(cls, obj, parts):
+        """Get a nested field from an object, given the split path."""
         for part in parts:
-            if isinstance(obj, dict):
-                if part not in obj:
-                    raise KeyError(f"Key '{part}' not found")
-                obj = obj[part]
-            elif isinstance(obj, list):
-                if not part.isdigit():
-                    raise KeyError(f"Invalid list index: {part}")
-                idx = int(part)
-                if idx >= len(obj):
-                    raise IndexError(f"List index out of range: {idx}")
-                obj = obj[idx]
-            else:
-                raise TypeError(f"Cannot access '{part}' on {type(obj)}")
+            obj = cls._step(obj, part)
+        return obj
+
+    @staticmethod
+    def _deref(obj):
+        """Turn a value into the object its next path part is read from."""
+        # List paths are plain JSON, relations and generators are not followed.
         return obj
+
+    @staticmethod
+    def _step(obj, part):
+        """Get one path part of an object."""
+        if isinstance(obj, dict):
+            if part not in obj:
+                raise KeyError(f"Key '{part}' not found")
+            return obj[part]
+        elif isinstance(obj, list):
+            if not part.isdigit():
+                raise KeyError(f"Invalid list index: {part}")
+            idx = int(part)
+            if idx >= len(obj):
+                raise IndexError(f"List index out of range: {idx}")
+            return obj[idx]
+        raise TypeError(f"Cannot access '{part}' on {type(obj)}")
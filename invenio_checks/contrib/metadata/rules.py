@@ -28,8 +28,12 @@ class Rule:
         condition=None,
         checks=None,
         error_path=None,
+        short_circuit=None,
     ):
-        """Initialize the rule."""
+        """Initialize the rule.
+
+        ``short_circuit`` overrides the evaluation mode passed to ``evaluate``.
+        """
         self.id = id
         self.title = title
         self.message = message
@@ -38,26 +42,98 @@ class Rule:
         self.condition = condition
         self.checks = checks or []
         self.error_path = error_path
+        self.short_circuit = short_circuit
+        self._compiled = {}
+
+    def compile(self, short_circuit=False):
+        """Compile the condition and the checks of the rule."""
+        condition = self.condition.compile(short_circuit) if self.condition else None
+        checks = tuple(check.compile(short_circuit) for check in self.checks)
+        self._compiled[short_circuit] = (condition, checks)
+        return condition, checks
+
+    def field_reads(self):
+        """Get the record fields the rule reads, as ``(reader, path)`` pairs.
+
+        Returns ``None`` if they are not known for one of its expressions.
+        """
+        reads = set()
+        for expr in [self.condition, *self.checks]:
+            if expr is None:
+                continue
+            expr_reads = expr.field_reads()
+            if expr_reads is None:
+                return None
+            reads |= expr_reads
+        return reads
+
+    def field_paths(self):
+        """Get the paths of the record fields the rule reads.
+
+        Returns ``None`` if they are not known for one of its expressions.
+        """
+        reads = self.field_reads()
+        if reads is None:
+            return None
+        return {path for _, path in reads}
+
+    def evaluate(self, record, fields=None, short_circuit=False, diagnostics=True):
+        """Evaluate the rule against a record.
+
+        ``fields`` is an optional :class:`FieldCache` of the record, to share the
+        field lookups with the other rules evaluated against it.
+
+        With ``short_circuit``, the evaluation stops at the first failing check.
+        The results of the remaining checks are then only computed if
+        ``diagnostics`` are needed, so that a failing rule has the same result as in
+        the full mode. Each check is evaluated at most once.
+        """
+        if self.short_circuit is not None:
+            short_circuit = self.short_circuit
+        short_circuit = bool(short_circuit)
+        condition, checks = self._compiled.get(short_circuit) or self.compile(
+            short_circuit
+        )
 
-    def evaluate(self, record):
-        """Evaluate the rule against a record."""
         # If there's a condition, evaluate it first
-        if self.condition:
-            condition_result = self.condition.evaluate(record)
+        if condition:
+            condition_result = condition(record, fields)
             if not condition_result.success:
                 # Condition failed, rule doesn't apply
                 return RuleResult.from_rule(
                     self, success=True, check_results=[], skipped=True
                 )
 
+        if short_circuit:
+            return self._evaluate_short_circuit(record, fields, checks, diagnostics)
+
         # Evaluate all checks
-        check_results = [check.evaluate(record) for check in self.checks]
+        check_results = [check(record, fields) for check in checks]
 
         # Create the rule result
         return RuleResult.from_rule(
             self, all(r.success for r in check_results), check_results
         )
 
+    def _evaluate_short_circuit(self, record, fields, checks, diagnostics):
+        """Evaluate the checks until the first failing one."""
+        check_results = []
+        for check in checks:
+            check_results.append(check(record, fields))
+            if not check_results[-1].success:
+                break
+        else:
+            return RuleResult.from_rule(self, True, check_results)
+
+        if diagnostics:
+            # The rule failed, so evaluate the remaining checks for the error
+            # messages. The short-circuit checks give the same results as the full
+            # ones, so the ones already evaluated are kept.
+            check_results += [
+                check(record, fields) for check in checks[len(check_results) :]
+            ]
+        return RuleResult.from_rule(self, False, check_results)
+
 
 @dataclass
 class RuleResult:
@@ -155,6 +231,7 @@ class RuleParser:
         description = config.get("description", "")
         level = config.get("level", "info")
         error_path = config.get("error_path")
+        short_circuit = config.get("short_circuit")
 
         # Parse condition if present
         condition = None
@@ -176,4 +253,5 @@ class RuleParser:
             condition,
             checks,
             error_path,
+            short_circuit,
         )
@@ -4,8 +4,11 @@
 
 """Invenio checks application."""
 
+from invenio_base.utils import obj_or_import_string
+
 from . import config
 from .base import ChecksRegistry, CheckTargetsRegistry
+from .cache import register_invalidation
 from .utils import aggregate_checks_severity, get_visible_checks, translate_field
 
 
@@ -31,6 +34,8 @@ class InvenioChecks(object):
         app.jinja_env.filters["translate_field"] = translate_field
         app.jinja_env.filters["aggregate_severity"] = aggregate_checks_severity
         app.jinja_env.globals["get_visible_checks"] = get_visible_checks
+        register_invalidation()
+        self.metrics = obj_or_import_string(app.config["CHECKS_METRICS_BACKEND"])()
 
     def init_config(self, app):
         """Initialize configuration."""
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Metrics of the check runs."""
+
+import time
+from contextlib import contextmanager
+
+
+class ChecksMetrics:
+    """Backend of the metrics of the check runs, which discards them.
+
+    Subclass it to export the metrics, e.g. to Prometheus or StatsD, and set
+    ``CHECKS_METRICS_BACKEND`` to the subclass. The backend is shared by the threads
+    of a process. The metrics are:
+
+    ``checks_run_duration_seconds`` (histogram, ``check_id``, ``target_type``,
+    ``mode``)
+        Time spent in ``Check.run``, on the save (``sync``) or in a worker
+        (``async``).
+
+    ``checks_runs_total`` (counter, ``check_id``, ``mode``)
+        Checks run on the save (``sync``), or queued for a worker (``async``).
+
+    ``checks_runs_skipped_total`` (counter, ``check_id``, ``reason``)
+        Checks not run again, because ``should_rerun`` said so (``should_rerun``) or
+        because their inputs did not change (``reused``).
+
+    ``checks_queue_wait_seconds`` (histogram, ``check_id``)
+        Time from the queuing of a run to the start of its worker.
+
+    ``checks_stale_runs_total`` (counter)
+        Runs failed by :func:`~invenio_checks.tasks.cleanup_stale_check_runs`.
+    """
+
+    def increment(self, name, value=1, **labels):
+        """Add ``value`` to a counter."""
+
+    def observe(self, name, value, **labels):
+        """Add a value to a histogram."""
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Add the duration of the block to a histogram, in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
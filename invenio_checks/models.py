@@ -97,9 +97,26 @@ class CheckRun(db.Model, db.Timestamp):
     status = db.Column(ChoiceType(CheckRunStatus, impl=db.CHAR(1)), nullable=False)
     state = db.Column(JSON, nullable=False)
     result = db.Column(JSON, nullable=False)
+    input_digest = db.Column(db.String(64), nullable=True)
 
     __table_args__ = (
         db.Index("idx_checks_run_config_id_record_id", config_id, record_id),
+        db.Index("idx_checks_run_record_id_is_draft", record_id, is_draft),
+        # Partial indexes of the runs not finished yet, for the stale runs cleanup
+        db.Index(
+            "idx_checks_run_unfinished_start_time",
+            status,
+            start_time,
+            postgresql_where=db.text("status IN ('P', 'R')"),
+            sqlite_where=db.text("status IN ('P', 'R')"),
+        ),
+        db.Index(
+            "idx_checks_run_unfinished_updated",
+            status,
+            "updated",
+            postgresql_where=db.text("status IN ('P', 'R')"),
+            sqlite_where=db.text("status IN ('P', 'R')"),
+        ),
         db.UniqueConstraint(
             "config_id",
             "record_id",
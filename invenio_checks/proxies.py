@@ -12,3 +12,7 @@ current_checks_registry = LocalProxy(
 current_targets_registry = LocalProxy(
     lambda: current_app.extensions["invenio-checks"].targets_registry
 )
+
+current_checks_metrics = LocalProxy(
+    lambda: current_app.extensions["invenio-checks"].metrics
+)
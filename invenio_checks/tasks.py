@@ -7,24 +7,40 @@
 
 """Checks Tasks."""
 
+import time
 from datetime import datetime, timezone
 
-from celery import shared_task
+from celery import chain, group, shared_task
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app
+from invenio_cache import current_cache
 from invenio_db import db
 from invenio_records_resources.services.uow import UnitOfWork
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, select
 
-from .models import CheckRun, CheckRunStatus
+from .base import Check
+from .models import CheckConfig, CheckRun, CheckRunStatus
+from .proxies import current_checks_metrics
 
 
-@shared_task(bind=True, max_retries=3, soft_time_limit=120, time_limit=180)
+@shared_task(
+    bind=True,
+    max_retries=Check.max_retries,
+    soft_time_limit=Check.soft_time_limit,
+    time_limit=Check.time_limit,
+)
 def run_check_async(self, check_run_id):
-    """Celery task to run a check asynchronously."""
+    """Celery task to run a check asynchronously.
+
+    Failures are retried with the policy of the check class: ``max_retries``, an
+    exponential backoff with jitter, and its ``non_retryable_exceptions``. Send the
+    task with the ``time_limits`` of the check class.
+    """
     from .api import ChecksAPI
 
     started = None
+    # Until the run is loaded, e.g. while the database is down
+    check_cls = Check
     try:
         # Set RUNNING before loading the record, so the record cannot be older than
         # this write. The status filter stops a retry from restarting a run that
@@ -54,6 +70,9 @@ def run_check_async(self, check_run_id):
             return None
 
         config = check_run.config
+        if config:
+            check_cls = ChecksAPI.get_check_cls(config.check_id)
+            observe_queue_wait(check_run, started)
         target = ChecksAPI.get_target(check_run)
 
         if not config or not target:
@@ -91,9 +110,14 @@ def run_check_async(self, check_run_id):
             },
         )
 
-        if self.request.retries < self.max_retries:
-            # Retry after 10s, 20s, then 30s.
-            raise self.retry(exc=e, countdown=(self.request.retries + 1) * 10)
+        retryable = not isinstance(e, check_cls.non_retryable_exceptions)
+        if retryable and self.request.retries < check_cls.max_retries:
+            raise self.retry(
+                exc=e,
+                countdown=check_cls.retry_countdown(self.request.retries),
+                max_retries=check_cls.max_retries,
+                **check_cls.time_limits(),
+            )
 
         try:
             db.session.rollback()
@@ -122,38 +146,386 @@ def run_check_async(self, check_run_id):
         return None
 
 
+def observe_queue_wait(check_run, started):
+    """Add the time a run waited for its worker to the metrics.
+
+    The bulk update setting the run to RUNNING leaves ``updated`` as is, so it is
+    still the time the run was queued.
+    """
+    current_checks_metrics.observe(
+        "checks_queue_wait_seconds",
+        (started - check_run.updated).total_seconds(),
+        check_id=check_run.config.check_id,
+    )
+
+
+def stale_check_runs_filter(cutoff):
+    """Get the condition of the runs unfinished since before ``cutoff``.
+
+    Each branch of the condition matches one of the partial indexes of the
+    unfinished runs.
+    """
+    return or_(
+        and_(
+            CheckRun.status == CheckRunStatus.RUNNING,
+            # The worker rewrites `start_time` when it starts, so a run that
+            # waited in the queue is not failed the moment it begins.
+            CheckRun.start_time < cutoff,
+        ),
+        and_(
+            CheckRun.status == CheckRunStatus.PENDING,
+            # No worker picked it up, so `updated` is when it was written.
+            CheckRun.updated < cutoff,
+        ),
+    )
+
+
+def stale_check_runs_query(cutoff, batch_size, last_id=None):
+    """Get the select of the next batch of stale runs, after the run ``last_id``.
+
+    The batches walk the runs by id. On PostgreSQL, runs locked by another
+    transaction are skipped.
+    """
+    query = (
+        select(CheckRun.id)
+        .where(stale_check_runs_filter(cutoff))
+        .order_by(CheckRun.id)
+        .limit(batch_size)
+    )
+    if last_id is not None:
+        query = query.where(CheckRun.id > last_id)
+    if db.session.get_bind().dialect.name == "postgresql":
+        query = query.with_for_update(skip_locked=True)
+    return query
+
+
+@shared_task(bind=True, max_retries=Check.max_retries)
+def run_checks_async(self, check_run_ids, debounced=False):
+    """Celery task to run the checks of many check runs asynchronously.
+
+    The runs are set to RUNNING and loaded together, and the target of each record or
+    draft is resolved once. A run that fails is sent to :func:`run_check_async`,
+    which retries it on its own. If the runs cannot be started, e.g. while the
+    database is down, the whole task is retried with the policy of :class:`Check`.
+
+    When the soft time limit of the task is reached, the finished runs are committed
+    and the remaining ones are sent to :func:`run_check_async`, with the time limits
+    of their check class.
+
+    ``debounced`` tasks release the debounce window of their runs first, so that a
+    save from now on sends a new task.
+    """
+    from .api import ChecksAPI, RunChecksTaskOp
+
+    if debounced:
+        current_cache.delete_many(
+            *[RunChecksTaskOp.debounce_key.format(id_) for id_ in check_run_ids]
+        )
+
+    try:
+        started = datetime.now(timezone.utc)
+        db.session.query(CheckRun).filter(
+            CheckRun.id.in_(check_run_ids),
+            CheckRun.status.in_([CheckRunStatus.PENDING, CheckRunStatus.RUNNING]),
+        ).update(
+            {"status": CheckRunStatus.RUNNING, "start_time": started},
+            synchronize_session=False,
+        )
+        db.session.commit()
+
+        # Runs that already finished, or that are gone, were not updated
+        runs = (
+            CheckRun.query.filter(
+                CheckRun.id.in_(check_run_ids), CheckRun.start_time == started
+            )
+            .options(ChecksAPI.config_loader())
+            .all()
+        )
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.exception(
+            "Error starting async check runs",
+            extra={
+                "check_run_count": len(check_run_ids),
+                "retry": self.request.retries,
+            },
+        )
+        # Runs left PENDING or RUNNING are failed by the stale runs cleanup
+        raise self.retry(
+            exc=e,
+            countdown=Check.retry_countdown(self.request.retries),
+            max_retries=Check.max_retries,
+        )
+
+    targets = {}
+    done, failed = [], []
+    # Read before running the checks, since a rolled back run may be expired
+    check_ids = [(str(run.id), run.config.check_id) for run in runs]
+    with UnitOfWork() as uow:
+        for i, run in enumerate(runs):
+            run_id = str(run.id)
+            try:
+                observe_queue_wait(run, started)
+                key = (run.config.target_type, run.record_id, run.is_draft)
+                if key not in targets:
+                    targets[key] = ChecksAPI.get_target(run)
+                if not targets[key]:
+                    current_app.logger.error(
+                        "Config or target not found",
+                        extra={"check_run_id": run_id},
+                    )
+                    continue
+                # In a nested transaction, so a failing run does not roll back the
+                # results of the others.
+                with db.session.begin_nested():
+                    ChecksAPI.run_check(
+                        run.config,
+                        targets[key],
+                        uow,
+                        sync=True,
+                        is_draft=run.is_draft,
+                        started=started,
+                        runs={(run.config_id, run.is_draft): run},
+                    )
+                done.append(run_id)
+            except SoftTimeLimitExceeded:
+                # Keep the finished runs before the hard time limit kills the task
+                current_app.logger.warning(
+                    "Async check runs timed out, retrying the remaining ones alone",
+                    extra={"check_run_count": len(runs) - i},
+                )
+                failed.extend(check_ids[i:])
+                break
+            except Exception:
+                current_app.logger.exception(
+                    "Error running async check run, retrying it alone",
+                    extra={"check_run_id": run_id},
+                )
+                failed.append(check_ids[i])
+        uow.commit()
+
+    for run_id, check_id in failed:
+        run_check_async.apply_async(
+            args=[run_id],
+            **ChecksAPI.get_task_options(check_id),
+            **ChecksAPI.get_check_cls(check_id).time_limits(),
+        )
+    return done
+
+
 @shared_task
-def cleanup_stale_check_runs():
-    """Fail check runs whose worker never came back."""
+def cleanup_stale_check_runs(batch_size=None):
+    """Fail check runs whose worker never came back.
+
+    The runs are failed in batches of ``batch_size`` (``CHECKS_RUN_STALE_BATCH_SIZE``
+    by default), each in its own transaction, so that draft saves are not blocked on
+    the locks of the whole sweep. The batches walk the runs by id. On PostgreSQL,
+    runs locked by another transaction are skipped, and left for the next sweep.
+
+    Returns the number of failed runs and the metrics of each batch.
+    """
+    batch_size = batch_size or current_app.config["CHECKS_RUN_STALE_BATCH_SIZE"]
     now = datetime.now(timezone.utc)
     cutoff = now - current_app.config["CHECKS_RUN_STALE_AFTER"]
-    stale = CheckRun.query.filter(
-        or_(
-            and_(
-                CheckRun.status == CheckRunStatus.RUNNING,
-                # The worker rewrites `start_time` when it starts, so a run that
-                # waited in the queue is not failed the moment it begins.
-                CheckRun.start_time < cutoff,
-            ),
-            and_(
-                CheckRun.status == CheckRunStatus.PENDING,
-                # No worker picked it up, so `updated` is when it was written.
-                CheckRun.updated < cutoff,
-            ),
+
+    batches = []
+    last_id = None
+    while True:
+        batch_start = time.perf_counter()
+        query = stale_check_runs_query(cutoff, batch_size, last_id)
+        ids = db.session.execute(query).scalars().all()
+        if not ids:
+            db.session.commit()
+            break
+
+        failed = CheckRun.query.filter(
+            CheckRun.id.in_(ids),
+            # Without row locks, a run may have started again since it was selected
+            stale_check_runs_filter(cutoff),
+        ).update(
+            {
+                "status": CheckRunStatus.ERROR,
+                "end_time": now,
+                # Clear `state` like the error path above, so the next save runs the
+                # check again.
+                "state": {"error": "Check run did not finish"},
+            },
+            synchronize_session=False,
         )
-    ).update(
-        {
-            "status": CheckRunStatus.ERROR,
-            "end_time": now,
-            # Clear `state` like the error path above, so the next save runs the
-            # check again.
-            "state": {"error": "Check run did not finish"},
-        },
-        synchronize_session=False,
-    )
-    db.session.commit()
+        db.session.commit()
+        current_checks_metrics.increment("checks_stale_runs_total", failed)
+        last_id = ids[-1]
+        batches.append(
+            {
+                "selected": len(ids),
+                "failed": failed,
+                "duration_ms": round((time.perf_counter() - batch_start) * 1000, 2),
+            }
+        )
+        if len(ids) < batch_size:
+            break
 
+    stale = sum(batch["failed"] for batch in batches)
     if stale:
         current_app.logger.warning(
-            "Failed stale check runs", extra={"check_run_count": stale}
+            "Failed stale check runs",
+            extra={"check_run_count": stale, "batch_count": len(batches)},
+        )
+    return {"failed": stale, "batches": batches}
+
+
+@shared_task(ignore_result=False)
+def recheck_check_runs(check_run_ids):
+    """Run the checks of many check runs again, in a single transaction.
+
+    Each run is checked in a savepoint, so that a run failing to be written does
+    not fail the others. When the soft time limit of the task is reached, the
+    finished runs are committed and the remaining ones count as failed.
+
+    The task does not fail, since it is chained with the next chunks of a bulk
+    re-check: an error is logged, and the runs that were not committed count as
+    failed.
+
+    Returns how many runs were checked, could not be checked, or were skipped
+    because their target is gone.
+    """
+    from .api import ChecksAPI
+
+    counts = {"checked": 0, "failed": 0, "skipped": 0}
+    try:
+        runs = (
+            CheckRun.query.filter(CheckRun.id.in_(check_run_ids))
+            .options(ChecksAPI.config_loader())
+            .all()
+        )
+        with UnitOfWork() as uow:
+            for i, run in enumerate(runs):
+                run_id = str(run.id)
+                try:
+                    target = ChecksAPI.get_target(run)
+                    if not target:
+                        counts["skipped"] += 1
+                        continue
+                    # In a nested transaction, so a failing run does not roll back
+                    # the results of the others.
+                    with db.session.begin_nested():
+                        ChecksAPI.run_check(
+                            run.config,
+                            target,
+                            uow,
+                            sync=True,
+                            is_draft=run.is_draft,
+                            runs={(run.config_id, run.is_draft): run},
+                        )
+                    counts["checked"] += 1
+                except SoftTimeLimitExceeded:
+                    current_app.logger.warning(
+                        "Re-check time limit reached, skipping the remaining runs",
+                        extra={"check_run_count": len(runs) - i},
+                    )
+                    counts["failed"] += len(runs) - i
+                    break
+                except Exception:
+                    current_app.logger.exception(
+                        "Error re-checking check run",
+                        extra={"check_run_id": run_id},
+                    )
+                    counts["failed"] += 1
+            uow.commit()
+    except Exception:
+        db.session.rollback()
+        current_app.logger.exception(
+            "Error re-checking check runs",
+            extra={"check_run_count": len(check_run_ids)},
         )
+        counts = {
+            "checked": 0,
+            "failed": len(check_run_ids) - counts["skipped"],
+            "skipped": counts["skipped"],
+        }
+    return counts
+
+
+def _recheck(task, query, check_id=None):
+    """Re-check the runs of a query, in chunks spread over a few lanes.
+
+    The ids of the runs are read in pages of ``CHECKS_RECHECK_CHUNK_SIZE``, each page
+    being re-checked by one task. The tasks are chained in
+    ``CHECKS_RECHECK_CONCURRENCY`` lanes, which run in parallel. They are sent with
+    the task options of ``check_id`` for bulk work. A chunk that fails does not stop
+    the next ones of its lane, see :func:`recheck_check_runs`.
+
+    The ``PROGRESS`` state of ``task`` only covers the paging of the ids, until the
+    chunks are sent. The counts of each chunk are in the results of the group.
+    """
+    from .api import ChecksAPI
+
+    chunk_size = current_app.config["CHECKS_RECHECK_CHUNK_SIZE"]
+    concurrency = current_app.config["CHECKS_RECHECK_CONCURRENCY"]
+
+    chunks = []
+    total = 0
+    last_id = None
+    while True:
+        page = query.order_by(CheckRun.id).limit(chunk_size)
+        if last_id is not None:
+            page = page.where(CheckRun.id > last_id)
+        ids = db.session.execute(page).scalars().all()
+        if not ids:
+            break
+        chunks.append([str(id_) for id_ in ids])
+        total += len(ids)
+        last_id = ids[-1]
+        task.update_state(state="PROGRESS", meta={"runs": total, "chunks": len(chunks)})
+        if len(ids) < chunk_size:
+            break
+    db.session.commit()
+
+    if not chunks:
+        return {"runs": 0, "chunks": 0, "group_id": None}
+
+    options = ChecksAPI.get_task_options(check_id, bulk=True)
+    lanes = [
+        chain(
+            recheck_check_runs.si(chunk).set(**options)
+            for chunk in chunks[lane::concurrency]
+        )
+        for lane in range(min(concurrency, len(chunks)))
+    ]
+    result = group(lanes).apply_async()
+    current_app.logger.info(
+        "Re-checking check runs",
+        extra={"check_run_count": total, "chunk_count": len(chunks)},
+    )
+    return {"runs": total, "chunks": len(chunks), "group_id": result.id}
+
+
+@shared_task(bind=True, ignore_result=False)
+def recheck_config(self, config_id):
+    """Run a check configuration again on all the records it has checked.
+
+    Returns the number of runs and chunks, and the id of the group of tasks of the
+    chunks, whose results hold the counts of each chunk. The ``PROGRESS`` state of
+    the task only follows the reading of the runs, not the chunks as they run.
+    """
+    query = (
+        select(CheckRun.id)
+        .join(CheckRun.config)
+        .where(CheckConfig.id == config_id, CheckConfig.enabled.is_(True))
+    )
+    config = db.session.get(CheckConfig, config_id)
+    return _recheck(self, query, check_id=config.check_id if config else None)
+
+
+@shared_task(bind=True, ignore_result=False)
+def recheck_community(self, community_id):
+    """Run the check configurations of a community again on the records they checked.
+
+    See :func:`recheck_config` for the returned value.
+    """
+    query = (
+        select(CheckRun.id)
+        .join(CheckRun.config)
+        .where(CheckConfig.community_id == community_id, CheckConfig.enabled.is_(True))
+    )
+    return _recheck(self, query)
@@ -9,10 +9,24 @@ fixtures are available.
 
 import json
 import os
+import uuid
 
 import pytest
 from invenio_app.factory import create_app as _create_app
 
+from invenio_checks.models import CheckConfig, Severity
+
+
+class Record(dict):
+    """Record or draft with the attributes read by the checks."""
+
+    def __init__(self, data, id_=None, is_draft=True, revision_id=1):
+        """Initialize the record."""
+        super().__init__(data)
+        self.id = id_ or uuid.uuid4()
+        self.is_draft = is_draft
+        self.revision_id = revision_id
+
 
 @pytest.fixture(scope="module")
 def create_app(instance_path):
@@ -28,3 +42,49 @@ def example_rules_config():
     )
     with open(example_file_path, "r", encoding="utf-8") as f:
         return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def access_rules():
+    """Metadata check rules requiring the record to be public."""
+    return {
+        "rules": [
+            {
+                "id": "access",
+                "level": "error",
+                "checks": [
+                    {
+                        "type": "comparison",
+                        "left": {"type": "field", "path": "access.record"},
+                        "operator": "==",
+                        "right": "public",
+                    }
+                ],
+            }
+        ]
+    }
+
+
+@pytest.fixture(scope="session")
+def make_record():
+    """Build records or drafts with the attributes read by the checks."""
+    return Record
+
+
+@pytest.fixture
+def make_config(db, access_rules):
+    """Create global metadata check configurations, with the access rules."""
+
+    def _make_config(**kwargs):
+        kwargs.setdefault("params", access_rules)
+        config = CheckConfig(
+            check_id="metadata",
+            severity=Severity.INFO,
+            target_type="record",
+            **kwargs,
+        )
+        db.session.add(config)
+        db.session.flush()
+        return config
+
+    return _make_config
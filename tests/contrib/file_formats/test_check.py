@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 """Tests for the file formats check."""
 
+import hashlib
 from dataclasses import dataclass
 
 import pytest
@@ -50,3 +51,14 @@ def test_default_file_format_check(app, record_with_files):
             "severity": "info",
         }
     ]
+
+
+def test_input_fingerprint(appctx, record_with_files, known_files_path):
+    """Test that the fingerprint depends on the file keys and the known formats."""
+    check = FileFormatsCheck()
+    config = CheckConfig(check_id="file_formats", params={}, severity=Severity.INFO)
+
+    assert check.input_fingerprint(record_with_files, config) == {
+        "known_formats": hashlib.sha256(known_files_path.read_bytes()).hexdigest(),
+        "files": ["file1.dwg", "file2.pdf"],
+    }
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+"""Tests for the metadata check caches."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from invenio_checks.contrib.metadata.cache import RulesCache
+from invenio_checks.contrib.metadata.check import MetadataCheck
+
+RULES_PARAMS = {
+    "rules": [
+        {
+            "id": "access",
+            "checks": [
+                {
+                    "type": "comparison",
+                    "left": {"type": "field", "path": "access"},
+                    "operator": "==",
+                    "right": "open",
+                }
+            ],
+        },
+        # Invalid rules are skipped
+        {"title": "No id"},
+    ]
+}
+
+
+def _config(id_=None, updated=None, params=None):
+    """Build a minimal check configuration."""
+    return SimpleNamespace(
+        id=id_ or uuid.uuid4(),
+        updated=updated or datetime.now(timezone.utc),
+        params=params or RULES_PARAMS,
+    )
+
+
+class TestRulesCache:
+    """Tests for the RulesCache class."""
+
+    def test_hit_and_miss(self):
+        """Test that the rules are parsed once per configuration."""
+        cache = RulesCache(maxsize=2)
+        config = _config()
+
+        rules = cache.get(config, MetadataCheck.parse_rules)
+        assert [r.id for r in rules] == ["access"]
+        assert cache.get(config, MetadataCheck.parse_rules) is rules
+
+        info = cache.info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_updated_config_is_reparsed(self):
+        """Test that editing a configuration invalidates its entry."""
+        cache = RulesCache(maxsize=2)
+        config = _config()
+        rules = cache.get(config, MetadataCheck.parse_rules)
+
+        edited = _config(
+            id_=config.id,
+            updated=config.updated + timedelta(seconds=1),
+            params={"rules": [{"id": "other"}]},
+        )
+        edited_rules = cache.get(edited, MetadataCheck.parse_rules)
+
+        assert edited_rules is not rules
+        assert [r.id for r in edited_rules] == ["other"]
+        # The old entry is replaced, not kept next to the new one
+        assert cache.info().currsize == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used configuration is evicted."""
+        cache = RulesCache(maxsize=2)
+        first, second, third = _config(), _config(), _config()
+
+        cache.get(first, MetadataCheck.parse_rules)
+        cache.get(second, MetadataCheck.parse_rules)
+        # Touch the first one, so that the second one is evicted
+        cache.get(first, MetadataCheck.parse_rules)
+        cache.get(third, MetadataCheck.parse_rules)
+
+        assert cache.info().currsize == 2
+        cache.get(first, MetadataCheck.parse_rules)
+        assert cache.info().hits == 2
+        cache.get(second, MetadataCheck.parse_rules)
+        assert cache.info().misses == 4
+
+    def test_unsaved_config_is_not_cached(self):
+        """Test that configurations without an id bypass the cache."""
+        cache = RulesCache(maxsize=2)
+        config = _config()
+        config.id = None
+
+        cache.get(config, MetadataCheck.parse_rules)
+        cache.get(config, MetadataCheck.parse_rules)
+
+        assert cache.info() == (0, 0, 2, 0)
+
+    def test_clear(self):
+        """Test clearing the cache."""
+        cache = RulesCache(maxsize=2)
+        cache.get(_config(), MetadataCheck.parse_rules)
+        cache.clear()
+
+        assert cache.info() == (0, 0, 2, 0)
@@ -10,6 +10,9 @@ from invenio_records.systemfields.relations.results import (
 
 from invenio_checks.contrib.metadata.expressions import (
     ComparisonExpression,
+    Expression,
+    ExpressionResult,
+    FieldCache,
     FieldExpression,
     ListExpression,
     LogicalExpression,
@@ -1302,3 +1305,317 @@ class TestListExpression:
 
         assert result.success is True
         assert result.path == "contributors"
+
+
+COMPILE_RECORDS = [
+    {
+        "title": "Open data",
+        "year": 2023,
+        "keywords": ["physics", "data"],
+        "access": {"status": "open"},
+        "creators": [{"name": "Smith", "ids": ["orcid"]}, {"name": "Doe"}],
+        "relation": SimpleRelationResult({"id": "cc-by-4.0"}),
+    },
+    {"title": "", "year": "2023", "keywords": [], "creators": []},
+    {"title": None, "keywords": "physics", "creators": {"name": "Smith"}},
+    {},
+]
+
+COMPILE_EXPRESSIONS = [
+    *[
+        ComparisonExpression(FieldExpression(path), operator, right)
+        for path in ("title", "year", "keywords", "access.status", "missing")
+        for operator, right in [
+            ("==", "Open data"),
+            ("!=", "Open data"),
+            ("~=", "data"),
+            ("!~=", "data"),
+            ("^=", "Open"),
+            ("!^=", "Open"),
+            ("$=", "data"),
+            ("!$=", "data"),
+            ("in", ["Open data", 2023, "physics"]),
+            ("not in", ["Open data", 2023, "physics"]),
+            ("in", 42),
+            ("min", 2),
+            ("max", 2),
+            ("min", "2"),
+        ]
+    ],
+    FieldExpression("relation.id"),
+    FieldExpression("creators.1.name"),
+    FieldExpression("creators.5.name"),
+    LogicalExpression(
+        "or",
+        [
+            ComparisonExpression(FieldExpression("year"), "==", 2023),
+            ComparisonExpression(FieldExpression("title"), "^=", "Open"),
+        ],
+    ),
+    LogicalExpression("and", []),
+    *[
+        ListExpression(
+            operator,
+            "creators",
+            ComparisonExpression(FieldExpression("name"), "==", "Smith"),
+        )
+        for operator in ("any", "all")
+    ],
+    ListExpression("exists", "keywords"),
+    ListExpression(
+        "any",
+        "creators",
+        ListExpression(
+            "any", "ids", ComparisonExpression(FieldExpression("0"), "==", "o")
+        ),
+    ),
+]
+
+
+class TestCompile:
+    """Tests for compiled expressions."""
+
+    @pytest.mark.parametrize("expr", COMPILE_EXPRESSIONS)
+    def test_compiled_matches_evaluate(self, expr):
+        """Test that the compiled expression gives the same results."""
+        compiled = expr.compile()
+        for record in COMPILE_RECORDS:
+            assert compiled(record) == expr.evaluate(record)
+
+    @pytest.mark.parametrize("expr", COMPILE_EXPRESSIONS)
+    def test_field_cache_matches_evaluate(self, expr):
+        """Test that evaluating with a shared field cache gives the same results."""
+        compiled = expr.compile()
+        for record in COMPILE_RECORDS:
+            fields = FieldCache(record)
+            # Twice, to also compare the results read from the cache
+            assert compiled(record, fields) == expr.evaluate(record)
+            assert compiled(record, fields) == expr.evaluate(record)
+
+    @pytest.mark.parametrize("expr", COMPILE_EXPRESSIONS)
+    def test_short_circuit_matches_evaluate(self, expr):
+        """Test that the short-circuit mode gives the same results."""
+        compiled = expr.compile(short_circuit=True)
+        for record in COMPILE_RECORDS:
+            assert compiled(record) == expr.evaluate(record)
+
+    def test_short_circuit_stops_at_deciding_item(self):
+        """Test that the short-circuit mode stops at the first deciding item."""
+        evaluated = []
+
+        class Recording(FieldExpression):
+            def compile(self, short_circuit=False):
+                compiled = super().compile(short_circuit)
+
+                def evaluate(record, fields=None):
+                    evaluated.append(record)
+                    return compiled(record, fields)
+
+                return evaluate
+
+        record = {"creators": [{"name": "Smith"}, {"name": "Doe"}, {"name": "Roe"}]}
+        expr = ListExpression(
+            "any",
+            "creators",
+            LogicalExpression(
+                "or",
+                [
+                    ComparisonExpression(Recording("name"), "==", "Doe"),
+                    ComparisonExpression(Recording("name"), "==", "Doe"),
+                ],
+            ),
+        )
+
+        assert expr.compile(short_circuit=True)(record).success is True
+        assert evaluated == [{"name": "Smith"}, {"name": "Smith"}, {"name": "Doe"}]
+
+        evaluated.clear()
+        assert expr.compile()(record).success is True
+        assert len(evaluated) == 6
+
+    def test_compile_resolves_operator_once(self):
+        """Test that the operator is resolved when compiling."""
+        expr = ComparisonExpression(FieldExpression("access"), "==", "open")
+        compiled = expr.compile()
+        expr.operator = "!="
+
+        assert compiled({"access": "open"}).success is True
+        assert expr.evaluate({"access": "open"}).success is False
+
+    def test_custom_expression(self):
+        """Test that a custom expression taking only the record can be nested."""
+
+        class IsOpen(Expression):
+            def evaluate(self, record):
+                return ExpressionResult(record.get("access") == "open")
+
+        expr = LogicalExpression(
+            "and",
+            [IsOpen(), ComparisonExpression(FieldExpression("title"), "==", "Test")],
+        )
+        compiled = expr.compile()
+        record = {"access": "open", "title": "Test"}
+        assert compiled(record).success is True
+        assert compiled(record, FieldCache(record)).success is True
+        assert compiled({"access": "closed", "title": "Test"}).success is False
+
+    def test_custom_expression_evaluate(self):
+        """Test that a nested custom expression taking only the record is evaluated."""
+
+        class Access(Expression):
+            def evaluate(self, record):
+                return ExpressionResult(True, "access", record.get("access"))
+
+        record = {"access": "open", "title": "Test", "creators": [{"access": "open"}]}
+        comparison = ComparisonExpression(Access(), "==", "open")
+        logical = LogicalExpression(
+            "and",
+            [comparison, ComparisonExpression(FieldExpression("title"), "==", "Test")],
+        )
+        list_expr = ListExpression("all", "creators", comparison)
+        for expr in (comparison, logical, list_expr):
+            assert expr.evaluate(record).success is True
+            assert expr.evaluate(record, FieldCache(record)).success is True
+        assert logical.evaluate({"access": "closed", "title": "Test"}).success is False
+
+
+class CountingRelationResult(SimpleRelationResult):
+    """Relation result counting how often it is dereferenced."""
+
+    calls = 0
+
+    def __call__(self, *args, **kwargs):
+        """Count the call and return the stored value."""
+        self.calls += 1
+        return super().__call__(*args, **kwargs)
+
+
+class TestFieldCache:
+    """Tests for FieldCache class."""
+
+    def test_relation_dereferenced_once(self):
+        """Test that a relation is dereferenced once for all expressions."""
+        relation = CountingRelationResult({"id": "cc-by-4.0", "title": "CC BY"})
+        record = {"metadata": {"rights": relation}}
+        fields = FieldCache(record)
+
+        for path in ("metadata.rights.id", "metadata.rights.title"):
+            assert FieldExpression(path).evaluate(record, fields).success is True
+        missing = FieldExpression("metadata.rights.missing")
+        assert missing.evaluate(record, fields).success is False
+
+        assert relation.calls == 1
+
+    def test_prefix_is_reused(self):
+        """Test that a path reuses the walk of its prefix."""
+
+        class Recorder(dict):
+            reads = 0
+
+            def __getitem__(self, key):
+                Recorder.reads += 1
+                return super().__getitem__(key)
+
+        record = Recorder(metadata={"resource_type": {"id": "dataset"}})
+        fields = FieldCache(record)
+
+        assert fields.resolve(FieldExpression, record, ("metadata",)) == {
+            "resource_type": {"id": "dataset"}
+        }
+        assert (
+            fields.resolve(FieldExpression, record, ("metadata", "resource_type", "id"))
+            == "dataset"
+        )
+        assert fields.resolve(FieldExpression, record, ("metadata",))
+        assert Recorder.reads == 1
+
+    def test_other_records_are_not_cached(self):
+        """Test that lookups on other objects than the record are not memoized."""
+        record = {"title": "Record"}
+        fields = FieldCache(record)
+
+        result = FieldExpression("title").evaluate({"title": "Item"}, fields)
+        assert result.value == "Item"
+        assert FieldExpression("title").evaluate(record, fields).value == "Record"
+
+    def test_generators_are_not_shared(self):
+        """Test that a generator value is read again for each lookup."""
+
+        class Parent:
+            @property
+            def communities(self):
+                return (c for c in ["a", "b"])
+
+        record = {"parent": Parent()}
+        fields = FieldCache(record)
+
+        for _ in range(2):
+            result = FieldExpression("parent.communities.1").evaluate(record, fields)
+            assert result.value == "b"
+
+
+class TestComparisonLookups:
+    """Tests for the lookup structures of list right sides."""
+
+    def test_in_with_large_vocabulary(self):
+        """Test 'in' and 'not in' against a list turned into a set."""
+        licenses = [f"license-{i}" for i in range(5000)]
+        expr = ComparisonExpression(FieldExpression("license"), "in", licenses)
+        not_expr = ComparisonExpression(FieldExpression("license"), "not in", licenses)
+
+        assert isinstance(expr._right_lookup, frozenset)
+        assert expr.evaluate({"license": "license-4999"}).success is True
+        assert expr.evaluate({"license": "proprietary"}).success is False
+        assert not_expr.evaluate({"license": "proprietary"}).success is True
+
+        # The message still shows the configured list
+        result = expr.evaluate({"license": "proprietary"})
+        assert result.message == expr.NOT_IN.format(
+            path="license", expected=licenses, actual="proprietary"
+        )
+
+    def test_in_with_unhashable_values(self):
+        """Test 'in' with unhashable values on either side."""
+        expr = ComparisonExpression(FieldExpression("ids"), "in", [["a"], ["b"]])
+        assert expr._right_lookup is None
+        assert expr.evaluate({"ids": ["b"]}).success is True
+
+        expr = ComparisonExpression(FieldExpression("ids"), "in", ["a", "b"])
+        assert expr.evaluate({"ids": ["a"]}).success is False
+
+    @pytest.mark.parametrize(
+        "operator,value,expected",
+        [
+            ("^=", "https://doi.org/10.1234", True),
+            ("^=", "https://orcid.org/0000", True),
+            ("^=", "http://doi.org/10.1234", False),
+            ("!^=", "http://doi.org/10.1234", True),
+            ("!^=", "https://doi.org/10.1234", False),
+            ("$=", "article.pdf", True),
+            ("$=", "data.csv", True),
+            ("$=", "data.xlsx", False),
+            ("!$=", "data.xlsx", True),
+            ("!$=", "article.pdf", False),
+        ],
+    )
+    def test_affix_lists(self, operator, value, expected):
+        """Test prefix and suffix operators with a list of values."""
+        affixes = (
+            ["https://doi.org/", "https://orcid.org/"]
+            if "^" in operator
+            else [".pdf", ".csv", ".tar.gz"]
+        )
+        expr = ComparisonExpression(FieldExpression("value"), operator, affixes)
+        result = expr.evaluate({"value": value})
+
+        assert result.success is expected
+
+    def test_affix_trie_empty_affix(self):
+        """Test that an empty prefix matches any value."""
+        expr = ComparisonExpression(FieldExpression("value"), "^=", ["", "x"])
+        assert expr.evaluate({"value": "abc"}).success is True
+
+    def test_affix_list_invalid(self):
+        """Test that non-string prefixes are rejected at parse time."""
+        with pytest.raises(ValueError):
+            ComparisonExpression(FieldExpression("value"), "^=", ["a", 1])
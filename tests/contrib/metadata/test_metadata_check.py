@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+"""Tests for the metadata check."""
+
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from invenio_records.systemfields.relations.results import RelationResult
+
+from invenio_checks.contrib.metadata.check import MetadataCheck, MetadataCheckConfig
+
+
+@pytest.fixture(scope="module")
+def example_check_config():
+    """Load the example metadata check configuration."""
+    example_file_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "example.json"
+    )
+    with open(example_file_path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    return MetadataCheckConfig.from_dict({"id": "example", **config})
+
+
+def test_field_paths(example_check_config):
+    """Test collecting the fields read by the rules."""
+    rule_paths = set()
+    for rule in example_check_config.rules:
+        rule_paths |= rule.field_paths()
+
+    # Paths inside list predicates are relative to the items, so the list is read
+    assert rule_paths == {
+        "access.files",
+        "custom_fields.journal:journal.title",
+        "metadata.funding",
+        "metadata.license.type",
+        "metadata.resource_type.id",
+        "metadata.rights",
+    }
+
+
+def test_input_digest(app):
+    """Test that the digest changes only with the fields read by the rules."""
+    check = MetadataCheck()
+    config = SimpleNamespace(
+        id=uuid.uuid4(),
+        updated=datetime.now(timezone.utc),
+        params={
+            "rules": [
+                {
+                    "id": "access",
+                    "checks": [
+                        {
+                            "type": "comparison",
+                            "left": {"type": "field", "path": "access.record"},
+                            "operator": "==",
+                            "right": "public",
+                        }
+                    ],
+                }
+            ]
+        },
+    )
+    record = {"access": {"record": "public"}, "metadata": {"title": "Title"}}
+    digest = check.input_digest(record, config)
+    assert digest is not None
+
+    # A field that no rule reads
+    record["metadata"]["title"] = "Other title"
+    assert check.input_digest(record, config) == digest
+
+    record["access"]["record"] = "restricted"
+    assert check.input_digest(record, config) != digest
+
+    # The same record with other params
+    record["access"]["record"] = "public"
+    other_config = SimpleNamespace(
+        id=uuid.uuid4(),
+        updated=config.updated,
+        params={"rules": [{**config.params["rules"][0], "level": "error"}]},
+    )
+    assert check.input_digest(record, other_config) != digest
+
+
+def test_input_digest_shares_field_lookups(appctx):
+    """Test that the run reuses the field lookups of the input digest."""
+
+    class CountingRelationResult(RelationResult):
+        calls = 0
+
+        def __init__(self, value):
+            self._value = value
+
+        def __call__(self, *args, **kwargs):
+            self.calls += 1
+            return self._value
+
+    def comparison(path, right):
+        return {
+            "type": "comparison",
+            "left": {"type": "field", "path": path},
+            "operator": "==",
+            "right": right,
+        }
+
+    config = SimpleNamespace(
+        id=uuid.uuid4(),
+        updated=datetime.now(timezone.utc),
+        params={
+            "rules": [
+                {"id": "license", "checks": [comparison("metadata.rights.id", "mit")]},
+                {
+                    "id": "creators",
+                    "checks": [
+                        {
+                            "type": "list",
+                            "operator": "exists",
+                            "path": "metadata.creators",
+                        }
+                    ],
+                },
+            ]
+        },
+    )
+    relation = CountingRelationResult({"id": "mit"})
+    record = {"metadata": {"rights": relation, "creators": [{"name": "Doe"}]}}
+
+    check = MetadataCheck()
+    context = check.run_context(record, config)
+    assert check.input_digest(record, config, **context) is not None
+    result, _ = check.run(record, config, **context)
+    assert result.success is True
+    assert relation.calls == 1
+
+
+@pytest.mark.parametrize("diagnostics,errors", [(True, 2), (False, 1)])
+def test_run_diagnostics(appctx, monkeypatch, diagnostics, errors):
+    """Test that the run only evaluates all checks of a failing rule if needed."""
+    monkeypatch.setitem(appctx.config, "CHECKS_METADATA_SHORT_CIRCUIT", True)
+    monkeypatch.setitem(appctx.config, "CHECKS_METADATA_DIAGNOSTICS", diagnostics)
+    config = SimpleNamespace(
+        id=None,
+        params={
+            "rules": [
+                {
+                    "id": "access",
+                    "level": "error",
+                    "checks": [
+                        {
+                            "type": "comparison",
+                            "left": {"type": "field", "path": path},
+                            "operator": "==",
+                            "right": "open",
+                        }
+                        for path in ("access.record", "access.files")
+                    ],
+                }
+            ]
+        },
+    )
+
+    result, _ = MetadataCheck().run({"access": {}}, config)
+    assert result.success is False
+    assert len(result.errors) == errors
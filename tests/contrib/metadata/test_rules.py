@@ -7,6 +7,8 @@ import pytest
 
 from invenio_checks.contrib.metadata.expressions import (
     ComparisonExpression,
+    Expression,
+    ExpressionResult,
     FieldExpression,
     LogicalExpression,
 )
@@ -248,6 +250,77 @@ class TestRule:
         # Second check passes
         assert result.check_results[1].success is True
 
+    def test_rule_short_circuit(self):
+        """Test that the short-circuit mode stops at the first failing check."""
+        record = {"type": "dataset", "access": "restricted", "license": "cc-by"}
+        rule = Rule(
+            id="test-rule",
+            title="Test Rule",
+            message="A test rule",
+            level="error",
+            checks=[
+                ComparisonExpression(FieldExpression("type"), "==", "dataset"),
+                ComparisonExpression(FieldExpression("access"), "==", "open"),
+                ComparisonExpression(FieldExpression("license"), "==", "cc-0"),
+            ],
+        )
+
+        result = rule.evaluate(record, short_circuit=True, diagnostics=False)
+        assert result.success is False
+        assert len(result.check_results) == 2
+
+        # With diagnostics, a failing rule reports all of its checks
+        assert rule.evaluate(record, short_circuit=True) == rule.evaluate(record)
+
+        passing = {"type": "dataset", "access": "open", "license": "cc-0"}
+        assert rule.evaluate(passing, short_circuit=True) == rule.evaluate(passing)
+
+    @pytest.mark.parametrize("diagnostics,evaluated", [(True, 3), (False, 2)])
+    def test_rule_short_circuit_evaluates_once(self, diagnostics, evaluated):
+        """Test that the short-circuit mode evaluates each check at most once."""
+
+        class Counting(Expression):
+            calls = 0
+
+            def __init__(self, success):
+                self.success = success
+
+            def evaluate(self, record, fields=None):
+                self.calls += 1
+                return ExpressionResult(self.success)
+
+        checks = [Counting(True), Counting(False), Counting(False)]
+        rule = Rule(
+            id="test-rule",
+            title="Test Rule",
+            message="A test rule",
+            level="error",
+            checks=checks,
+        )
+
+        result = rule.evaluate({}, short_circuit=True, diagnostics=diagnostics)
+        assert result.success is False
+        assert len(result.check_results) == evaluated
+        assert [check.calls for check in checks] == [1, 1, int(diagnostics)]
+
+    def test_rule_short_circuit_override(self):
+        """Test that the rule's own mode overrides the one passed in."""
+        record = {"type": "book", "access": "restricted"}
+        rule = Rule(
+            id="test-rule",
+            title="Test Rule",
+            message="A test rule",
+            level="error",
+            checks=[
+                ComparisonExpression(FieldExpression("type"), "==", "dataset"),
+                ComparisonExpression(FieldExpression("access"), "==", "open"),
+            ],
+            short_circuit=False,
+        )
+
+        result = rule.evaluate(record, short_circuit=True, diagnostics=False)
+        assert len(result.check_results) == 2
+
 
 class TestRuleParser:
     """Tests for the RuleParser class."""
@@ -277,6 +350,13 @@ class TestRuleParser:
         assert rule.level == "error"
         assert len(rule.checks) == 1
         assert isinstance(rule.checks[0], ComparisonExpression)
+        assert rule.short_circuit is None
+
+    def test_parse_rule_with_short_circuit(self):
+        """Test parsing a rule with its own evaluation mode."""
+        rule = RuleParser.parse({"id": "test-rule", "short_circuit": True})
+
+        assert rule.short_circuit is True
 
     def test_parse_rule_with_condition(self):
         """Test parsing a rule with a condition."""
@@ -0,0 +1,283 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the checks API."""
+
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+import pytest
+from invenio_communities.communities.records.models import CommunityMetadata
+from invenio_records_resources.services.uow import UnitOfWork
+from sqlalchemy import event
+
+from invenio_checks.api import ChecksAPI
+from invenio_checks.contrib.metadata.check import MetadataCheck
+from invenio_checks.models import CheckRunStatus
+from invenio_checks.tasks import run_checks_async
+
+
+@pytest.fixture
+def configs(db, make_config):
+    """Global metadata check configurations."""
+    configs = [make_config() for _ in range(3)]
+    db.session.commit()
+    return configs
+
+
+@pytest.fixture
+def queries(db):
+    """Collect the SELECT statements."""
+    statements = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before)
+
+
+def run_queries(queries):
+    """Get the queries of the check runs table."""
+    return [query for query in queries if "FROM checks_run" in query]
+
+
+def test_run_checks(db, configs, queries, make_record):
+    """Test that the previous runs of all configurations are loaded at once."""
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+    with UnitOfWork(db.session) as uow:
+        runs = ChecksAPI.run_checks(configs, record, uow)
+        assert len(run_queries(queries)) == 1
+        uow.commit()
+
+    assert len(runs) == 3
+    assert all(run.status == CheckRunStatus.COMPLETED for run in runs)
+
+    # A new draft starts from the published runs, found in the same query
+    draft = make_record(
+        {"access": {"record": "restricted"}}, id_=record.id, revision_id=2
+    )
+    queries.clear()
+    with UnitOfWork(db.session) as uow:
+        draft_runs = ChecksAPI.run_checks(configs, draft, uow)
+        assert len(run_queries(queries)) == 1
+        uow.commit()
+
+    assert {run.id for run in draft_runs}.isdisjoint({run.id for run in runs})
+    assert all(run.is_draft and run.revision_id == 2 for run in draft_runs)
+    assert all(run.result["success"] is False for run in draft_runs)
+
+
+def test_run_checks_skips_failing_checks(db, configs, monkeypatch, make_record):
+    """Test that a failing check does not stop the other ones."""
+    calls = []
+    run_check = ChecksAPI.run_check
+
+    def failing_run_check(config, *args, **kwargs):
+        calls.append(config)
+        if len(calls) == 1:
+            raise ValueError("Check failed")
+        return run_check(config, *args, **kwargs)
+
+    monkeypatch.setattr(ChecksAPI, "run_check", failing_run_check)
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+    with UnitOfWork(db.session) as uow:
+        runs = ChecksAPI.run_checks(configs, record, uow)
+        uow.commit()
+
+    assert len(calls) == 3
+    assert len(runs) == 2
+
+
+@pytest.mark.parametrize("loader,expected_queries", [("selectin", 2), ("joined", 1)])
+def test_get_runs_with_config(
+    base_app, db, configs, queries, monkeypatch, loader, expected_queries, make_record
+):
+    """Test that the configurations are loaded along with the runs."""
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+    with UnitOfWork(db.session) as uow:
+        ChecksAPI.run_checks(configs, record, uow)
+        uow.commit()
+    config_ids = {config.id for config in configs}
+    db.session.expunge_all()
+    monkeypatch.setitem(base_app.config, "CHECKS_RUNS_CONFIG_LOADER", loader)
+
+    queries.clear()
+    runs = ChecksAPI.get_runs(record)
+    assert {run.config.id for run in runs} == config_ids
+    assert len(queries) == expected_queries
+
+    # Without the configurations, each one is loaded on access
+    db.session.expunge_all()
+    queries.clear()
+    runs = ChecksAPI.get_runs(record, with_config=False)
+    assert [run.config for run in runs]
+    assert len(queries) == 1 + len(config_ids)
+
+
+def test_get_runs_of_community(db, queries, make_config, make_record):
+    """Test getting the runs of a community, of its parent and the global ones."""
+
+    def community(parent=None):
+        data = {"parent": {"id": str(parent.id)}} if parent else {}
+        model = CommunityMetadata(id=uuid.uuid4(), slug=str(uuid.uuid4()), data=data)
+        db.session.add(model)
+        return model
+
+    parent = community()
+    child = community(parent)
+    other = community()
+    db.session.flush()
+
+    configs = {
+        "global": make_config(),
+        "child": make_config(community_id=child.id),
+        "parent": make_config(community_id=parent.id),
+        "other": make_config(community_id=other.id),
+        "disabled": make_config(community_id=child.id, enabled=False),
+    }
+    db.session.commit()
+
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+    with UnitOfWork(db.session) as uow:
+        ChecksAPI.run_checks(list(configs.values()), record, uow)
+        uow.commit()
+    config_names = {config.id: name for name, config in configs.items()}
+    child_id, parent_id = child.id, parent.id
+    db.session.expunge_all()
+
+    queries.clear()
+    runs = ChecksAPI.get_runs(record, community_id=child_id)
+    assert {config_names[run.config.id] for run in runs} == {
+        "global",
+        "child",
+        "parent",
+    }
+    assert len(queries) == 1
+
+    runs = ChecksAPI.get_runs(record, community_id=parent_id)
+    assert {config_names[run.config.id] for run in runs} == {"global", "parent"}
+
+
+def test_run_checks_upsert(db, configs, queries, monkeypatch, make_record):
+    """Test that the new runs are written in one statement, updating existing ones."""
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+    with UnitOfWork(db.session) as uow:
+        first_run = ChecksAPI.run_check(configs[0], record, uow)
+        uow.commit()
+    first_run_id = first_run.id
+
+    inserts = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO checks_run"):
+            inserts.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before)
+    try:
+        # As if another request created the first run after the runs were read
+        record["access"]["record"] = "restricted"
+        record.revision_id = 2
+        with UnitOfWork(db.session) as uow:
+            runs = ChecksAPI.run_checks(configs, record, uow, runs=[])
+            uow.commit()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before)
+
+    assert len(inserts) == 1
+    assert runs[0].id == first_run_id
+    db.session.expire_all()
+    assert len({run.id for run in runs}) == 3
+    assert all(run.revision_id == 2 for run in runs)
+    assert all(run.result["success"] is False for run in runs)
+
+
+def test_run_checks_upsert_fallback(db, configs, monkeypatch, make_record):
+    """Test that the runs are written one by one when the upsert fails."""
+    run = MetadataCheck.run
+
+    def unserializable_run(self, record, config, **kwargs):
+        res, state = run(self, record, config, **kwargs)
+        if config.id == configs[0].id:
+            state = {"value": object()}
+        return res, state
+
+    monkeypatch.setattr(MetadataCheck, "run", unserializable_run)
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+    with UnitOfWork(db.session) as uow:
+        runs = ChecksAPI.run_checks(configs, record, uow)
+        uow.commit()
+
+    # The run that cannot be written is skipped, the other ones are written
+    assert {run.config_id for run in runs} == {config.id for config in configs[1:]}
+    db.session.expire_all()
+    assert {run.config_id for run in ChecksAPI.get_runs(record)} == {
+        config.id for config in configs[1:]
+    }
+
+
+def test_run_checks_executor(base_app, db, configs, monkeypatch, make_record):
+    """Test that thread-safe checks run concurrently, storing their runs after."""
+    barrier = threading.Barrier(2, timeout=5)
+    run = MetadataCheck.run
+
+    def concurrent_run(self, *args, **kwargs):
+        # Waits for a second check to run at the same time
+        barrier.wait()
+        return run(self, *args, **kwargs)
+
+    monkeypatch.setattr(MetadataCheck, "thread_safe", True)
+    monkeypatch.setattr(MetadataCheck, "run", concurrent_run)
+    monkeypatch.setitem(base_app.config, "CHECKS_SYNC_EXECUTOR_WORKERS", 2)
+
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+    with UnitOfWork(db.session) as uow:
+        runs = ChecksAPI.run_checks(configs[:2], record, uow)
+        uow.commit()
+
+    assert {run.config_id for run in runs} == {config.id for config in configs[:2]}
+    assert all(run.status == CheckRunStatus.COMPLETED for run in runs)
+    assert all(run.result["success"] for run in runs)
+
+
+def test_run_checks_sync_budget(base_app, db, configs, monkeypatch, make_record):
+    """Test that sync checks over the budget of the save are run async."""
+    sent = []
+    monkeypatch.setattr(
+        run_checks_async, "apply_async", lambda args, **kwargs: sent.extend(args[0])
+    )
+    run = MetadataCheck.run
+
+    def slow_run(self, *args, **kwargs):
+        time.sleep(0.05)
+        return run(self, *args, **kwargs)
+
+    monkeypatch.setattr(MetadataCheck, "run", slow_run)
+    monkeypatch.setitem(base_app.config, "CHECKS_SYNC_BUDGET_MS", 10)
+
+    # The first check spends the budget, the other ones are run async
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+    with UnitOfWork(db.session) as uow:
+        runs = ChecksAPI.run_checks(configs, record, uow)
+        uow.commit()
+    statuses = [run.status for run in runs]
+    assert statuses == [CheckRunStatus.COMPLETED] + [CheckRunStatus.PENDING] * 2
+    assert sorted(sent) == sorted(str(run.id) for run in runs[1:])
+
+    # A check whose previous run took longer than the budget is run async at once
+    monkeypatch.setattr(MetadataCheck, "run", run)
+    monkeypatch.setitem(base_app.config, "CHECKS_SYNC_BUDGET_MS", 1000)
+    runs[0].end_time = runs[0].start_time + timedelta(seconds=2)
+    db.session.commit()
+    record["access"]["record"] = "restricted"
+    record.revision_id = 2
+    sent.clear()
+    with UnitOfWork(db.session) as uow:
+        runs = ChecksAPI.run_checks(configs, record, uow)
+        uow.commit()
+    assert sent == [str(runs[0].id)]
+    assert runs[0].status == CheckRunStatus.PENDING
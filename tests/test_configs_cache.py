@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the check configurations cache."""
+
+import time
+
+import pytest
+from sqlalchemy import event
+
+from invenio_checks.api import ChecksAPI
+from invenio_checks.models import CheckConfig, Severity
+
+
+@pytest.fixture
+def configs_cache(base_app, db, monkeypatch):
+    """Enable the configurations cache, starting empty."""
+    monkeypatch.setitem(base_app.config, "CHECKS_CONFIGS_CACHE_ENABLED", True)
+    cache = ChecksAPI.configs_cache
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture
+def config(db):
+    """A global check configuration."""
+    config = CheckConfig(
+        check_id="metadata",
+        params={"rules": []},
+        severity=Severity.INFO,
+        target_type="record",
+    )
+    db.session.add(config)
+    db.session.commit()
+    return config
+
+
+@pytest.fixture
+def config_queries(db):
+    """Collect the queries of the configurations table."""
+    statements = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT") and "FROM checks_config" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before)
+
+
+def test_get_configs_cached(db, configs_cache, config, config_queries):
+    """Test that the configurations are only loaded once."""
+    config_id = config.id
+    config_queries.clear()
+    assert config_id in {c.id for c in ChecksAPI.get_configs([])}
+    assert len(config_queries) == 1
+
+    db.session.expunge_all()
+    configs = {c.id: c for c in ChecksAPI.get_configs([])}
+    assert len(config_queries) == 1
+    assert configs[config_id].params == {"rules": []}
+    # The configurations belong to the current session
+    assert configs[config_id] in db.session
+
+
+def test_get_configs_invalidated(db, configs_cache, config, config_queries):
+    """Test that committing a change to a configuration invalidates the cache."""
+    ChecksAPI.get_configs([])
+    config.enabled = False
+    db.session.commit()
+    config_queries.clear()
+
+    assert config not in ChecksAPI.get_configs([])
+    assert len(config_queries) == 1
+
+
+def test_get_configs_expired(db, configs_cache, config, config_queries, monkeypatch):
+    """Test that the cached configurations expire."""
+    ChecksAPI.get_configs([])
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + configs_cache.ttl + 1)
+
+    ChecksAPI.get_configs([])
+    assert len(config_queries) == 2
@@ -3,9 +3,13 @@
 
 """Module tests."""
 
+from types import SimpleNamespace
+
 from flask import Flask
 
 from invenio_checks import InvenioChecks
+from invenio_checks.base import Check
+from invenio_checks.models import Severity
 
 
 def test_version():
@@ -26,3 +30,47 @@ def test_init():
     assert "invenio-checks" not in app.extensions
     ext.init_app(app)
     assert "invenio-checks" in app.extensions
+
+
+def test_input_digest():
+    """Test the input digest of a check."""
+
+    class FilesCheck(Check):
+        id = "files"
+
+        def input_fingerprint(self, record, config):
+            return sorted(record["files"])
+
+    config = SimpleNamespace(params={"max": 1}, severity=Severity.INFO)
+    digest = FilesCheck().input_digest({"files": ["b", "a"]}, config)
+    assert digest == FilesCheck().input_digest({"files": ["a", "b"]}, config)
+    assert digest != FilesCheck().input_digest({"files": ["a"]}, config)
+
+    config.severity = Severity.FAIL
+    assert digest != FilesCheck().input_digest({"files": ["b", "a"]}, config)
+
+    # Checks without a fingerprint always run
+    assert Check().input_digest({"files": []}, config) is None
+
+    # Values which are not JSON are not reduced to their string
+    assert FilesCheck().input_digest({"files": [object()]}, config) is None
+
+
+def test_retry_countdown():
+    """Test the exponential backoff of the retries of a check."""
+
+    class SlowCheck(Check):
+        retry_backoff = 5
+        retry_backoff_max = 60
+        retry_jitter = False
+
+    assert [SlowCheck.retry_countdown(retries) for retries in range(5)] == [
+        5,
+        10,
+        20,
+        40,
+        60,
+    ]
+
+    # With jitter, anything up to the backoff
+    assert all(0 <= Check.retry_countdown(2) <= 40 for _ in range(20))
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the metrics of the check runs."""
+
+import time
+
+import pytest
+from invenio_records_resources.services.uow import UnitOfWork
+
+from invenio_checks.api import ChecksAPI
+from invenio_checks.contrib.metadata.check import MetadataCheck
+from invenio_checks.metrics import ChecksMetrics
+from invenio_checks.tasks import run_checks_async
+
+
+class RecordingMetrics(ChecksMetrics):
+    """Metrics backend keeping the values it gets."""
+
+    def __init__(self):
+        """Initialize the backend."""
+        self.counters = {}
+        self.histograms = {}
+
+    def increment(self, name, value=1, **labels):
+        """Add ``value`` to a counter."""
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        """Add a value to a histogram."""
+        key = (name, tuple(sorted(labels.items())))
+        self.histograms.setdefault(key, []).append(value)
+
+
+@pytest.fixture
+def metrics(base_app, monkeypatch):
+    """Record the metrics of the checks."""
+    metrics = RecordingMetrics()
+    monkeypatch.setattr(base_app.extensions["invenio-checks"], "metrics", metrics)
+    return metrics
+
+
+@pytest.fixture
+def config(db, make_config):
+    """Global metadata check configuration."""
+    config = make_config()
+    db.session.commit()
+    return config
+
+
+def test_default_backend(base_app):
+    """Test that the metrics are discarded by default."""
+    metrics = base_app.extensions["invenio-checks"].metrics
+    assert type(metrics) is ChecksMetrics
+    with metrics.timer("checks_run_duration_seconds", check_id="metadata"):
+        metrics.increment("checks_runs_total", check_id="metadata", mode="sync")
+
+
+def test_sync_metrics(db, config, metrics, make_record):
+    """Test the metrics of the checks run on a save."""
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+    for _ in range(2):
+        with UnitOfWork(db.session) as uow:
+            ChecksAPI.run_checks([config], record, uow)
+            uow.commit()
+
+    labels = (("check_id", "metadata"), ("mode", "sync"))
+    assert metrics.counters[("checks_runs_total", labels)] == 1
+    durations = metrics.histograms[
+        (
+            "checks_run_duration_seconds",
+            labels + (("target_type", "record"),),
+        )
+    ]
+    assert len(durations) == 1
+    # The second save has the same inputs
+    skipped = (("check_id", "metadata"), ("reason", "reused"))
+    assert metrics.counters[("checks_runs_skipped_total", skipped)] == 1
+
+
+def test_async_metrics(db, config, metrics, monkeypatch, make_record):
+    """Test the metrics of the checks run by a worker."""
+    monkeypatch.setattr(MetadataCheck, "sync", False)
+    sent = []
+    monkeypatch.setattr(
+        run_checks_async, "apply_async", lambda args, **kwargs: sent.extend(args[0])
+    )
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+    with UnitOfWork(db.session) as uow:
+        ChecksAPI.run_checks([config], record, uow)
+        uow.commit()
+    queued = (("check_id", "metadata"), ("mode", "async"))
+    assert metrics.counters[("checks_runs_total", queued)] == 1
+
+    monkeypatch.setattr(ChecksAPI, "get_target", classmethod(lambda cls, run: record))
+    assert run_checks_async(sent) == sent
+    (wait,) = metrics.histograms[
+        ("checks_queue_wait_seconds", (("check_id", "metadata"),))
+    ]
+    assert wait >= 0
+    durations = metrics.histograms[
+        (
+            "checks_run_duration_seconds",
+            queued + (("target_type", "record"),),
+        )
+    ]
+    assert len(durations) == 1
+
+
+def test_deferred_run_counted_once(
+    base_app, db, metrics, monkeypatch, make_config, make_record
+):
+    """Test that a thread pool check over the budget is only counted as async."""
+    configs = [make_config() for _ in range(2)]
+    db.session.commit()
+
+    run = MetadataCheck.run
+
+    def slow_run(self, *args, **kwargs):
+        time.sleep(0.2)
+        return run(self, *args, **kwargs)
+
+    monkeypatch.setattr(MetadataCheck, "thread_safe", True)
+    monkeypatch.setattr(MetadataCheck, "run", slow_run)
+    monkeypatch.setattr(run_checks_async, "apply_async", lambda *args, **kwargs: None)
+    monkeypatch.setitem(base_app.config, "CHECKS_SYNC_EXECUTOR_WORKERS", 2)
+    monkeypatch.setitem(base_app.config, "CHECKS_SYNC_BUDGET_MS", 10)
+
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+    with UnitOfWork(db.session) as uow:
+        ChecksAPI.run_checks(configs, record, uow)
+        uow.commit()
+
+    counters = {labels: value for (name, labels), value in metrics.counters.items()}
+    assert counters == {(("check_id", "metadata"), ("mode", "async")): 2}
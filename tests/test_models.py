@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the checks models."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from invenio_checks.models import CheckRun
+from invenio_checks.tasks import stale_check_runs_query
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN`` of a statement."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        """Initialize the explain."""
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def compile_explain(element, compiler, **kw):
+    """Compile the explain on PostgreSQL."""
+    return "EXPLAIN " + compiler.process(element.statement, **kw)
+
+
+@pytest.fixture
+def plan(db):
+    """Get the query plan of a statement, without sequential scans."""
+    if db.engine.name != "postgresql":
+        pytest.skip("Query plans are only checked on PostgreSQL.")
+    # The table is empty, so a sequential scan would always be the cheapest plan
+    db.session.execute(text("SET LOCAL enable_seqscan = off"))
+
+    def _plan(statement):
+        return "\n".join(db.session.execute(Explain(statement)).scalars())
+
+    return _plan
+
+
+@pytest.mark.parametrize("last_id", [None, uuid.uuid4()])
+def test_stale_check_runs_indexes(base_app, plan, last_id):
+    """Test that the batches of stale runs are found with the partial indexes."""
+    statement = stale_check_runs_query(
+        datetime.now(timezone.utc),
+        base_app.config["CHECKS_RUN_STALE_BATCH_SIZE"],
+        last_id,
+    )
+    query_plan = plan(statement)
+    # The plan of the batch the cleanup selects, with its row locks
+    assert "Limit" in query_plan
+    assert "LockRows" in query_plan
+    assert "idx_checks_run_unfinished_start_time" in query_plan
+    assert "idx_checks_run_unfinished_updated" in query_plan
+
+
+def test_record_runs_index(plan):
+    """Test that the runs of a record or draft are found with their index."""
+    statement = select(CheckRun).where(
+        CheckRun.record_id == uuid.uuid4(), CheckRun.is_draft.is_(True)
+    )
+    assert "idx_checks_run_record_id_is_draft" in plan(statement)
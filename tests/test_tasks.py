@@ -0,0 +1,560 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the checks tasks."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+from invenio_records_resources.services.uow import UnitOfWork
+from sqlalchemy.exc import OperationalError
+
+from invenio_checks import tasks
+from invenio_checks.api import ChecksAPI
+from invenio_checks.contrib.metadata.check import MetadataCheck
+from invenio_checks.models import CheckRun, CheckRunStatus
+from invenio_checks.tasks import (
+    cleanup_stale_check_runs,
+    recheck_check_runs,
+    recheck_config,
+    run_check_async,
+    run_checks_async,
+)
+
+
+def test_cleanup_stale_check_runs(db, make_config):
+    """Test that the stale runs are failed in batches."""
+    config = make_config(params={"rules": []})
+
+    old = datetime.now(timezone.utc) - timedelta(days=1)
+
+    def run(status, start_time=None, updated=None):
+        run = CheckRun(
+            config_id=config.id,
+            record_id=uuid.uuid4(),
+            status=status,
+            start_time=start_time,
+            state={},
+            result={},
+        )
+        db.session.add(run)
+        db.session.flush()
+        if updated:
+            CheckRun.query.filter_by(id=run.id).update(
+                {"updated": updated}, synchronize_session=False
+            )
+        return run.id
+
+    stale = [run(CheckRunStatus.RUNNING, start_time=old) for _ in range(3)]
+    stale += [run(CheckRunStatus.PENDING, updated=old) for _ in range(2)]
+    recent = [
+        run(CheckRunStatus.RUNNING, start_time=datetime.now(timezone.utc)),
+        run(CheckRunStatus.PENDING),
+        run(CheckRunStatus.COMPLETED, start_time=old, updated=old),
+    ]
+    db.session.commit()
+
+    metrics = cleanup_stale_check_runs(batch_size=2)
+
+    assert metrics["failed"] == 5
+    assert [batch["selected"] for batch in metrics["batches"]] == [2, 2, 1]
+    assert [batch["failed"] for batch in metrics["batches"]] == [2, 2, 1]
+
+    db.session.expire_all()
+    statuses = {run.id: run.status for run in CheckRun.query}
+    assert all(statuses[run_id] == CheckRunStatus.ERROR for run_id in stale)
+    assert all(statuses[run_id] != CheckRunStatus.ERROR for run_id in recent)
+
+    assert cleanup_stale_check_runs(batch_size=2) == {"failed": 0, "batches": []}
+
+
+def test_recheck_config(base_app, db, monkeypatch, make_config, make_record):
+    """Test that a configuration is run again on the records it checked."""
+    config = make_config()
+
+    records = {}
+    for _ in range(5):
+        record = make_record({"access": {"record": "restricted"}}, is_draft=False)
+        records[record.id] = record
+        db.session.add(
+            CheckRun(
+                config_id=config.id,
+                record_id=record.id,
+                status=CheckRunStatus.COMPLETED,
+                state={},
+                result={},
+            )
+        )
+    db.session.commit()
+    config_id = config.id
+
+    monkeypatch.setattr(
+        ChecksAPI, "get_target", classmethod(lambda cls, run: records[run.record_id])
+    )
+    monkeypatch.setitem(base_app.config, "CHECKS_RECHECK_CHUNK_SIZE", 2)
+    monkeypatch.setitem(base_app.config, "CHECKS_RECHECK_CONCURRENCY", 2)
+    chunks = []
+    recheck_runs = recheck_check_runs.run
+
+    def counted_recheck(check_run_ids):
+        chunks.append(check_run_ids)
+        return recheck_runs(check_run_ids)
+
+    monkeypatch.setattr(recheck_check_runs, "run", counted_recheck)
+
+    result = recheck_config.apply(args=[str(config_id)]).get()
+
+    assert result["runs"] == 5
+    assert result["chunks"] == 3
+    assert sorted(len(chunk) for chunk in chunks) == [1, 2, 2]
+    db.session.expire_all()
+    runs = CheckRun.query.filter_by(config_id=config_id).all()
+    assert all(run.result["success"] is False for run in runs)
+
+
+def test_recheck_config_failed_chunk(
+    base_app, db, monkeypatch, make_config, make_record
+):
+    """Test that a failing chunk does not stop the next chunks of its lane."""
+    config = make_config()
+    records = {}
+    for _ in range(5):
+        record = make_record({"access": {"record": "restricted"}}, is_draft=False)
+        records[record.id] = record
+        db.session.add(
+            CheckRun(
+                config_id=config.id,
+                record_id=record.id,
+                status=CheckRunStatus.COMPLETED,
+                state={},
+                result={},
+            )
+        )
+    db.session.commit()
+    config_id = config.id
+
+    monkeypatch.setattr(
+        ChecksAPI, "get_target", classmethod(lambda cls, run: records[run.record_id])
+    )
+    monkeypatch.setitem(base_app.config, "CHECKS_RECHECK_CHUNK_SIZE", 2)
+    monkeypatch.setitem(base_app.config, "CHECKS_RECHECK_CONCURRENCY", 1)
+    config_loader = ChecksAPI.config_loader.__func__
+    calls = []
+
+    def failing_loader(cls):
+        calls.append(True)
+        if len(calls) == 1:
+            raise OperationalError("SELECT", {}, Exception("Connection lost"))
+        return config_loader(cls)
+
+    monkeypatch.setattr(ChecksAPI, "config_loader", classmethod(failing_loader))
+
+    result = recheck_config.apply(args=[str(config_id)]).get()
+
+    assert result["chunks"] == 3
+    assert len(calls) == 3
+    db.session.expire_all()
+    runs = CheckRun.query.filter_by(config_id=config_id).all()
+    # The runs of the first chunk were not checked, the others were
+    assert sorted(bool(run.result) for run in runs) == [False, False, True, True, True]
+
+
+def test_recheck_check_runs_savepoints(db, monkeypatch, make_config, make_record):
+    """Test that a run failing to be written does not fail the others."""
+    config = make_config()
+    records = {}
+    run_ids = []
+    for _ in range(3):
+        record = make_record({"access": {"record": "restricted"}}, is_draft=False)
+        records[record.id] = record
+        run = CheckRun(
+            config_id=config.id,
+            record_id=record.id,
+            status=CheckRunStatus.COMPLETED,
+            state={},
+            result={},
+        )
+        db.session.add(run)
+        db.session.flush()
+        run_ids.append(str(run.id))
+    db.session.commit()
+    failing = run_ids[0]
+    failing_record = next(iter(records))
+
+    monkeypatch.setattr(
+        ChecksAPI, "get_target", classmethod(lambda cls, run: records[run.record_id])
+    )
+    check_run = MetadataCheck.run
+
+    def run(self, record, config, **kwargs):
+        res, state = check_run(self, record, config, **kwargs)
+        if record.id == failing_record:
+            # Not JSON serializable, so writing the run fails
+            state = {"value": object()}
+        return res, state
+
+    monkeypatch.setattr(MetadataCheck, "run", run)
+
+    counts = recheck_check_runs(run_ids)
+
+    assert counts == {"checked": 2, "failed": 1, "skipped": 0}
+    db.session.expire_all()
+    for run in CheckRun.query.filter(CheckRun.id.in_(run_ids)):
+        assert bool(run.result) is (str(run.id) != failing)
+
+
+def test_recheck_check_runs_soft_time_limit(db, monkeypatch, make_config, make_record):
+    """Test that the runs checked before the soft time limit are committed."""
+    config = make_config()
+    records = {}
+    run_ids = []
+    for _ in range(3):
+        record = make_record({"access": {"record": "restricted"}}, is_draft=False)
+        records[record.id] = record
+        run = CheckRun(
+            config_id=config.id,
+            record_id=record.id,
+            status=CheckRunStatus.COMPLETED,
+            state={},
+            result={},
+        )
+        db.session.add(run)
+        db.session.flush()
+        run_ids.append(str(run.id))
+    db.session.commit()
+
+    monkeypatch.setattr(
+        ChecksAPI, "get_target", classmethod(lambda cls, run: records[run.record_id])
+    )
+    run_check = ChecksAPI.run_check.__func__
+    calls = []
+
+    def timed_out_run_check(cls, *args, **kwargs):
+        calls.append(True)
+        if len(calls) == 2:
+            raise SoftTimeLimitExceeded()
+        return run_check(cls, *args, **kwargs)
+
+    monkeypatch.setattr(ChecksAPI, "run_check", classmethod(timed_out_run_check))
+
+    counts = recheck_check_runs(run_ids)
+
+    assert counts == {"checked": 1, "failed": 2, "skipped": 0}
+    assert len(calls) == 2
+    db.session.expire_all()
+    runs = CheckRun.query.filter(CheckRun.id.in_(run_ids)).all()
+    assert sorted(bool(run.result) for run in runs) == [False, False, True]
+
+
+def test_run_checks_async(db, monkeypatch, make_config, make_record):
+    """Test that the async checks of a unit of work run in a single task."""
+    configs = [make_config() for _ in range(3)]
+    db.session.commit()
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+
+    monkeypatch.setattr(MetadataCheck, "sync", False)
+    sent = []
+    monkeypatch.setattr(
+        run_checks_async, "apply_async", lambda args, **kwargs: sent.append(args[0])
+    )
+    with UnitOfWork(db.session) as uow:
+        runs = ChecksAPI.run_checks(configs, record, uow)
+        uow.commit()
+
+    assert len(sent) == 1
+    assert sorted(sent[0]) == sorted(str(run.id) for run in runs)
+    assert all(run.status == CheckRunStatus.PENDING for run in runs)
+
+    resolved = []
+
+    def get_target(cls, run):
+        resolved.append(run.id)
+        return record
+
+    monkeypatch.setattr(ChecksAPI, "get_target", classmethod(get_target))
+    retried = []
+    monkeypatch.setattr(
+        tasks.run_check_async,
+        "apply_async",
+        lambda args, **kwargs: retried.append(args[0]),
+    )
+    check_run = MetadataCheck.run
+
+    def run(self, record, config, **kwargs):
+        if config.id == configs[0].id:
+            raise ValueError("Check failed")
+        return check_run(self, record, config, **kwargs)
+
+    monkeypatch.setattr(MetadataCheck, "run", run)
+    run_ids = sent[0]
+
+    done = run_checks_async(run_ids)
+
+    assert len(resolved) == 1
+    assert len(done) == 2
+    failed_run_id = next(iter(set(run_ids) - set(done)))
+    assert retried == [failed_run_id]
+    db.session.expire_all()
+    statuses = {str(run.id): run.status for run in CheckRun.query}
+    assert [statuses[run_id] for run_id in done] == [CheckRunStatus.COMPLETED] * 2
+    assert statuses[failed_run_id] == CheckRunStatus.RUNNING
+
+
+def test_run_checks_async_retried(db, monkeypatch, make_config, make_record):
+    """Test that the task is retried when its runs cannot be started."""
+    config = make_config()
+    db.session.commit()
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+
+    monkeypatch.setattr(MetadataCheck, "sync", False)
+    sent = []
+    monkeypatch.setattr(
+        run_checks_async, "apply_async", lambda args, **kwargs: sent.extend(args[0])
+    )
+    with UnitOfWork(db.session) as uow:
+        ChecksAPI.run_checks([config], record, uow)
+        uow.commit()
+    monkeypatch.setattr(ChecksAPI, "get_target", classmethod(lambda cls, run: record))
+
+    # The database is down for the first attempt
+    query = db.session.query
+    calls = []
+
+    def failing_query(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise OperationalError("UPDATE checks_run", {}, Exception("down"))
+        return query(*args, **kwargs)
+
+    monkeypatch.setattr(db.session, "query", failing_query)
+    done = run_checks_async.apply(args=[sent]).get()
+
+    assert done == sent
+    db.session.expire_all()
+    run = CheckRun.query.filter_by(id=sent[0]).one()
+    assert run.status == CheckRunStatus.COMPLETED
+
+
+def test_run_checks_async_soft_time_limit(db, monkeypatch, make_config, make_record):
+    """Test that the remaining runs are sent alone when the task times out."""
+    configs = [make_config() for _ in range(3)]
+    db.session.commit()
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+
+    monkeypatch.setattr(MetadataCheck, "sync", False)
+    sent = []
+    monkeypatch.setattr(
+        run_checks_async, "apply_async", lambda args, **kwargs: sent.extend(args[0])
+    )
+    with UnitOfWork(db.session) as uow:
+        ChecksAPI.run_checks(configs, record, uow)
+        uow.commit()
+
+    monkeypatch.setattr(ChecksAPI, "get_target", classmethod(lambda cls, run: record))
+    retried = []
+    monkeypatch.setattr(
+        run_check_async,
+        "apply_async",
+        lambda args, **kwargs: retried.append((args[0], kwargs)),
+    )
+    check_run = MetadataCheck.run
+    calls = []
+
+    def run(self, record, config, **kwargs):
+        calls.append(config.id)
+        if len(calls) == 2:
+            raise SoftTimeLimitExceeded()
+        return check_run(self, record, config, **kwargs)
+
+    monkeypatch.setattr(MetadataCheck, "run", run)
+
+    done = run_checks_async(sent)
+
+    assert len(done) == 1
+    assert len(calls) == 2
+    assert sorted(run_id for run_id, _ in retried) == sorted(set(sent) - set(done))
+    assert all(
+        kwargs["soft_time_limit"] == MetadataCheck.soft_time_limit
+        for _, kwargs in retried
+    )
+    db.session.expire_all()
+    run = CheckRun.query.filter_by(id=done[0]).one()
+    assert run.status == CheckRunStatus.COMPLETED
+
+
+def test_run_checks_async_debounced(
+    base_app, db, monkeypatch, make_config, make_record
+):
+    """Test that the saves during the debounce window send a single task."""
+    configs = [make_config() for _ in range(2)]
+    db.session.commit()
+    draft = make_record({"access": {"record": "public"}})
+
+    monkeypatch.setattr(MetadataCheck, "sync", False)
+    monkeypatch.setitem(base_app.config, "CHECKS_ASYNC_DEBOUNCE", {"metadata": 30})
+    sent = []
+    monkeypatch.setattr(
+        run_checks_async, "apply_async", lambda **kwargs: sent.append(kwargs)
+    )
+
+    def save():
+        draft.revision_id += 1
+        with UnitOfWork(db.session) as uow:
+            runs = ChecksAPI.run_checks(configs, draft, uow)
+            uow.commit()
+        return sorted(str(run.id) for run in runs)
+
+    run_ids = save()
+    assert save() == run_ids
+    assert len(sent) == 1
+    assert sent[0]["countdown"] == 30
+    assert sent[0]["kwargs"] == {"debounced": True}
+    assert sorted(sent[0]["args"][0]) == run_ids
+
+    # Once the task runs, the next save sends a new one
+    monkeypatch.setattr(ChecksAPI, "get_target", classmethod(lambda cls, run: draft))
+    run_checks_async(run_ids, debounced=True)
+    draft["access"]["record"] = "restricted"
+    save()
+    assert len(sent) == 2
+
+
+def test_run_checks_async_debounced_send_error(
+    base_app, db, monkeypatch, make_config, make_record
+):
+    """Test that a debounced task that cannot be sent releases its window."""
+    config = make_config()
+    db.session.commit()
+    draft = make_record({"access": {"record": "public"}})
+
+    monkeypatch.setattr(MetadataCheck, "sync", False)
+    monkeypatch.setitem(base_app.config, "CHECKS_ASYNC_DEBOUNCE", {"metadata": 30})
+    sent = []
+
+    def apply_async(**kwargs):
+        sent.append(kwargs)
+        if len(sent) == 1:
+            raise ConnectionError("Broker unreachable")
+
+    monkeypatch.setattr(run_checks_async, "apply_async", apply_async)
+
+    for _ in range(2):
+        draft.revision_id += 1
+        with UnitOfWork(db.session) as uow:
+            ChecksAPI.run_checks([config], draft, uow)
+            uow.commit()
+    # The second save is not debounced away by the task that was never sent
+    assert len(sent) == 2
+
+
+@pytest.mark.parametrize(
+    "bulk,route,expected",
+    [
+        # The task has the time limits of both runs
+        (
+            False,
+            {"queue": "checks"},
+            {
+                "priority": 9,
+                "queue": "checks",
+                "soft_time_limit": 240,
+                "time_limit": 360,
+            },
+        ),
+        (
+            True,
+            {"queue": "checks"},
+            {
+                "priority": 0,
+                "queue": "checks",
+                "soft_time_limit": 240,
+                "time_limit": 360,
+            },
+        ),
+        # Options that are not hashable
+        (
+            False,
+            {"headers": {"origin": "checks"}},
+            {
+                "priority": 9,
+                "queue": "default",
+                "headers": {"origin": "checks"},
+                "soft_time_limit": 240,
+                "time_limit": 360,
+            },
+        ),
+        # Routed time limits are kept as is
+        (
+            True,
+            {"time_limit": 60},
+            {
+                "priority": 0,
+                "queue": "default",
+                "soft_time_limit": 240,
+                "time_limit": 60,
+            },
+        ),
+    ],
+)
+def test_run_checks_async_routes(
+    base_app, db, monkeypatch, bulk, route, expected, make_config, make_record
+):
+    """Test that the async checks are sent with their queue, priority and limits."""
+    configs = [make_config() for _ in range(2)]
+    db.session.commit()
+    record = make_record({"access": {"record": "public"}}, is_draft=False)
+
+    monkeypatch.setattr(MetadataCheck, "sync", False)
+    monkeypatch.setitem(
+        base_app.config, "CHECKS_TASK_PRIORITIES", {"interactive": 9, "bulk": 0}
+    )
+    monkeypatch.setitem(
+        base_app.config,
+        "CHECKS_TASK_ROUTES",
+        {"*": {"queue": "default"}, "metadata": route},
+    )
+    sent = []
+    monkeypatch.setattr(
+        run_checks_async, "apply_async", lambda args, **kwargs: sent.append(kwargs)
+    )
+    with UnitOfWork(db.session) as uow:
+        ChecksAPI.run_checks(configs, record, uow, bulk=bulk)
+        uow.commit()
+
+    assert sent == [expected]
+
+
+def test_run_check_async_non_retryable(db, monkeypatch, make_config, make_record):
+    """Test that the non-retryable exceptions of a check fail its run at once."""
+    config = make_config()
+    record = make_record({"access": {"record": "public"}})
+    run = CheckRun(
+        config_id=config.id,
+        record_id=record.id,
+        is_draft=True,
+        status=CheckRunStatus.PENDING,
+        state={},
+        result={},
+    )
+    db.session.add(run)
+    db.session.commit()
+    run_id = str(run.id)
+
+    def run_check(self, record, config, **kwargs):
+        raise ValueError("Invalid rules")
+
+    monkeypatch.setattr(MetadataCheck, "run", run_check)
+    monkeypatch.setattr(MetadataCheck, "non_retryable_exceptions", (ValueError,))
+    monkeypatch.setattr(ChecksAPI, "get_target", classmethod(lambda cls, run: record))
+    retries = []
+    monkeypatch.setattr(run_check_async, "retry", lambda **kwargs: retries.append(1))
+
+    run_check_async.apply(args=[run_id])
+
+    assert retries == []
+    db.session.expire_all()
+    run = db.session.get(CheckRun, run.id)
+    assert run.status == CheckRunStatus.ERROR
+    assert run.state == {"error": "Invalid rules"}